@@ -1,7 +1,10 @@
 import json
 import logging
 import os
+import shutil
 import subprocess
+import tempfile
+from typing import Optional, Tuple
 
 from src.utils.logging_config import setup_logger
 
@@ -20,10 +23,18 @@ DEFAULT_CONFIG = {
             "tools": [],
         }
     ],
-    "runtime": {"maxGlobalChildren": 100, "defaultTimeoutSeconds": 60},
+    "runtime": {
+        "maxGlobalChildren": 100,
+        "defaultTimeoutSeconds": 60,
+        "toolCacheTtlSeconds": 300,
+    },
     "mcpServers": {},
 }
 
+# Parsed config file and the (mtime_ns, size) of the file it was parsed from
+_cached_config: Optional[dict[str, object]] = None
+_cached_stat: Optional[Tuple[int, int]] = None
+
 
 def ensure_config_exists() -> None:
     """Ensure config directory and file exist, create if they don't."""
@@ -35,44 +46,94 @@ def ensure_config_exists() -> None:
         if not os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE, "w") as f:
                 json.dump(DEFAULT_CONFIG, f, indent=2)
-            logger.info(f"Created default config file at {CONFIG_FILE}")
+            logger.info("Created default config file at %s", CONFIG_FILE)
     except Exception as e:
-        logger.error(f"Error ensuring config exists: {str(e)}")
+        logger.error("Error ensuring config exists: %s", str(e))
         raise
 
 
 def edit_config() -> None:
-    """Open the config file in the user's preferred editor."""
+    """Open the config file in the user's preferred editor.
+
+    The editor works on a copy of the config, which only replaces the config file
+    once it parses as valid JSON. Invalid edits leave the current config in place.
+
+    Edits are picked up by get_config() at once, but values derived from the
+    config manager, which is cached per process, only change after a restart.
+
+    Raises:
+        ValueError: If the edited config is not valid UTF-8 encoded JSON.
+
+    """
+    global _cached_config, _cached_stat
     try:
         ensure_config_exists()
 
         # Get the user's preferred editor, fall back to vim
         editor = os.environ.get("EDITOR", "vim")
 
-        # Open the config file in the editor
-        logger.info(f"Opening config file with {editor}")
-        subprocess.run([editor, CONFIG_FILE])
+        # Edit a copy next to the config so the final rename stays atomic
+        fd, tmp_path = tempfile.mkstemp(
+            dir=CONFIG_DIR, prefix="config.", suffix=".json"
+        )
+        os.close(fd)
 
-        # Verify the config is valid JSON after editing
         try:
-            with open(CONFIG_FILE, "r") as f:
-                json.load(f)
-            logger.info("Config file successfully updated")
-        except json.JSONDecodeError:
-            logger.error("Warning: Config file contains invalid JSON!")
+            shutil.copyfile(CONFIG_FILE, tmp_path)
+            logger.info("Opening config file with %s", editor)
+            subprocess.run([editor, tmp_path])
+
+            # Verify the config is valid JSON before publishing it
+            with open(tmp_path, "r", encoding="utf-8") as f:
+                parsed: dict[str, object] = json.load(f)
+
+            # The copy was created private, so give it the config's permissions
+            shutil.copymode(CONFIG_FILE, tmp_path)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(
+                "Config file contains invalid JSON, keeping the previous config. "
+                "The edited copy is at %s",
+                tmp_path,
+            )
+            raise ValueError(f"Invalid JSON in edited config: {e}") from e
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        os.replace(tmp_path, CONFIG_FILE)
+
+        # Prime the cache with the config just parsed instead of reading it again
+        st = os.stat(CONFIG_FILE)
+        _cached_config, _cached_stat = parsed, (st.st_mtime_ns, st.st_size)
+        logger.info("Config file successfully updated")
 
     except Exception as e:
-        logger.error(f"Error editing config: {str(e)}")
+        logger.error("Error editing config: %s", str(e))
         raise
 
 
 def get_config() -> dict[str, object]:
-    """Read and return the current config."""
+    """Read and return the current config.
+
+    The parsed config is reused until the file's modification time or size
+    changes. Callers share the returned dict and must not modify it.
+    """
+    global _cached_config, _cached_stat
     try:
-        ensure_config_exists()
+        try:
+            st = os.stat(CONFIG_FILE)
+        except FileNotFoundError:
+            ensure_config_exists()
+            st = os.stat(CONFIG_FILE)
+
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if _cached_config is not None and stat_key == _cached_stat:
+            return _cached_config
+
         with open(CONFIG_FILE, "r") as f:
             config: dict[str, object] = json.load(f)
-            return config
+        _cached_config, _cached_stat = config, stat_key
+        return config
     except Exception as e:
-        logger.error(f"Error reading config: {str(e)}")
+        logger.error("Error reading config: %s", str(e))
         raise
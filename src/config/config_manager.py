@@ -9,13 +9,21 @@ from src.utils.logging_config import setup_logger
 
 logger = setup_logger(__name__, logging.INFO)
 
+# Seconds discovered MCP tool lists are kept before servers are queried again
+DEFAULT_TOOL_CACHE_TTL_SECONDS = 300.0
+
 
 @dataclass
 class MCPServerConfig:
-    """Configuration for an MCP server with command and arguments."""
+    """Configuration for an MCP server with command and arguments.
+
+    Servers are connected lazily on first use unless ``eager`` is set, in which
+    case their tools are discovered as soon as the MCP master is created.
+    """
 
     command: str
     args: List[str]
+    eager: bool = False
 
     def to_dict(self) -> dict[str, str | list[str]]:
         """Convert the configuration to a dictionary.
@@ -58,6 +66,19 @@ class MCPConfig:
         }
         return cls(mcp_servers=servers)
 
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, str | list[str]]]]:
+        """Convert the configuration to a dictionary.
+
+        Returns:
+            A dictionary in the same "mcpServers" shape the config file uses.
+
+        """
+        return {
+            "mcpServers": {
+                name: server.to_dict() for name, server in self.mcp_servers.items()
+            }
+        }
+
     def get_server(self, name: str) -> MCPServerConfig:
         """Get configuration for a specific server.
 
@@ -110,11 +131,15 @@ class RuntimeConfig:
     Args:
         max_global_children: Maximum number of child processes allowed.
         default_timeout_seconds: Default timeout for operations in seconds.
+        max_session_turns: Optional cap on the conversation turns kept per session.
+        tool_cache_ttl_seconds: Time after which discovered MCP tool lists expire.
 
     """
 
     max_global_children: int
     default_timeout_seconds: int
+    max_session_turns: Optional[int] = None
+    tool_cache_ttl_seconds: float = DEFAULT_TOOL_CACHE_TTL_SECONDS
 
 
 class ConfigManager:
@@ -125,6 +150,7 @@ class ConfigManager:
         self._agent_configs: Dict[str, AgentRuntime] = {}
         self._runtime: Optional[RuntimeConfig] = None
         self._mcp_config: Optional[MCPConfig] = None
+        self._main_agent_entry: Optional[tuple[RunnerType, AgentRuntime]] = None
         self._load_config()
 
     @property
@@ -137,12 +163,14 @@ class ConfigManager:
         """Get runtime configuration."""
         return self._runtime
 
+    @property
+    def main_agent(self) -> Optional[tuple[RunnerType, AgentRuntime]]:
+        """Get the runner type and configuration of the main agent, if any."""
+        return self._main_agent_entry
+
     def get_main_agent(self) -> Optional[AgentRuntime]:
         """Get the main agent configuration."""
-        for agent in self._agent_configs.values():
-            if agent.is_main:
-                return agent
-        return None
+        return self._main_agent_entry[1] if self._main_agent_entry else None
 
     def get_agent(self, name: str) -> Optional[AgentRuntime]:
         """Get an agent's configuration."""
@@ -174,6 +202,9 @@ class ConfigManager:
                     name, runtime = result
                     self._agent_configs[name] = runtime
 
+            # Index the main agent once so lookups don't scan the agents
+            self._index_main_agent()
+
             # Load runtime configuration
             self._load_runtime_config(config_data)
 
@@ -183,6 +214,23 @@ class ConfigManager:
             logger.error(f"Error loading configuration: {str(e)}")
             raise  # Re-raise as we don't want to silently use defaults
 
+    def _index_main_agent(self) -> None:
+        """Find the agent marked as main and store it for direct access.
+
+        Raises:
+            ValueError: If more than one agent is marked as main.
+
+        """
+        main_agents = [
+            (runtime.runner, runtime)
+            for runtime in self._agent_configs.values()
+            if runtime.is_main
+        ]
+        if len(main_agents) > 1:
+            names = [runner.value for runner, _ in main_agents]
+            raise ValueError(f"Only one agent can be marked as main, found: {names}")
+        self._main_agent_entry = main_agents[0] if main_agents else None
+
     def _load_mcp_config(self, config_data: dict) -> None:
         """Load MCP server configuration from config data.
 
@@ -204,17 +252,29 @@ class ConfigManager:
         if runtime_raw is not None and isinstance(runtime_raw, dict):
             max_children_raw = runtime_raw.get("maxGlobalChildren")
             timeout_raw = runtime_raw.get("defaultTimeoutSeconds")
+            max_turns_raw = runtime_raw.get("maxSessionTurns")
+            tool_cache_ttl_raw = runtime_raw.get("toolCacheTtlSeconds")
 
             if max_children_raw is not None and timeout_raw is not None:
                 try:
                     max_children = int(max_children_raw)
                     timeout = int(timeout_raw)
+                    max_turns = (
+                        int(max_turns_raw) if max_turns_raw is not None else None
+                    )
+                    tool_cache_ttl = (
+                        float(tool_cache_ttl_raw)
+                        if tool_cache_ttl_raw is not None
+                        else DEFAULT_TOOL_CACHE_TTL_SECONDS
+                    )
                     self._runtime = RuntimeConfig(
                         max_global_children=max_children,
                         default_timeout_seconds=timeout,
+                        max_session_turns=max_turns,
+                        tool_cache_ttl_seconds=tool_cache_ttl,
                     )
                 except (ValueError, TypeError):
-                    logger.error("Runtime configuration values must be integers")
+                    logger.error("Runtime configuration values must be numbers")
 
     def _validate_runner_type(
         self, runner_str: str, index: int
@@ -282,6 +342,9 @@ class ConfigManager:
 def get_config_manager() -> ConfigManager:
     """Get the singleton instance of ConfigManager.
 
+    The instance is created once and kept for the lifetime of the process, so
+    later edits to the config file take effect on the next start.
+
     Returns:
         The singleton ConfigManager instance.
 
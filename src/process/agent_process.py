@@ -2,14 +2,50 @@ import asyncio
 import logging
 import os
 import queue
+import threading
 from multiprocessing import Process, Queue, current_process
 from typing import Optional, cast
 
-from src.runner.runner_factory import create_runner
 from src.utils.logging_config import setup_logger
 
 from .agent_process_input import AgentProcessInput
 
+logger = setup_logger(__name__, logging.INFO)
+
+DEFAULT_ASK_CONCURRENCY = 16
+
+
+def _ask_concurrency_from_env() -> int:
+    """Get the limit on questions in flight across all agent processes.
+
+    Returns:
+        The ASK_CONCURRENCY environment variable if it is a positive integer,
+        else DEFAULT_ASK_CONCURRENCY.
+
+    """
+    value = os.getenv("ASK_CONCURRENCY")
+    if value is None:
+        return DEFAULT_ASK_CONCURRENCY
+    try:
+        concurrency = int(value)
+    except ValueError:
+        concurrency = 0
+    if concurrency < 1:
+        logger.warning(
+            "Invalid ASK_CONCURRENCY %r, must be a positive integer; using %d",
+            value,
+            DEFAULT_ASK_CONCURRENCY,
+        )
+        return DEFAULT_ASK_CONCURRENCY
+    return concurrency
+
+
+# Upper bound on questions to agent processes in flight at once. Slots are only
+# held for the round-trip itself, so questions queued behind a busy agent don't
+# take them from other agents.
+ASK_CONCURRENCY = _ask_concurrency_from_env()
+_ask_slots = threading.BoundedSemaphore(ASK_CONCURRENCY)
+
 
 class AgentProcess:
     """A class representing a separate process for running an agent.
@@ -27,6 +63,8 @@ class AgentProcess:
         self.input_q: Queue = Queue()
         self.output_q: Queue = Queue()
         self._input_config: AgentProcessInput = input_config
+        # One question at a time, so each response is paired with its question
+        self._ask_lock = threading.Lock()
         self.logger = setup_logger(__name__, logging.INFO)
         self.logger.info("Initializing agent process %s", input_config.name)
 
@@ -47,6 +85,10 @@ class AgentProcess:
         logger = setup_logger(f"{__name__}.{proc.name}", logging.INFO)
         logger.info("Starting agent process. PID: %d, Name: %s", os.getpid(), proc.name)
 
+        # Imported here so loading the module doesn't pull in the model SDKs; only
+        # the child process needs them
+        from src.runner.runner_factory import create_runner
+
         runner = None
         try:
             # Create runner inside the child process
@@ -116,26 +158,54 @@ class AgentProcess:
             self.proc.pid,
             message,
         )
-        self.input_q.put(message)
+        with self._ask_lock, _ask_slots:
+            self.input_q.put(message)
 
-        try:
-            response = cast(str, self.output_q.get(timeout=timeout))
-            return response
-        except queue.Empty as err:
-            msg = (
-                f"No response from process {self._input_config.name} "
-                f"within {timeout} seconds"
-            )
-            raise queue.Empty(msg) from err
+            try:
+                response = cast(str, self.output_q.get(timeout=timeout))
+                return response
+            except queue.Empty as err:
+                msg = (
+                    f"No response from process {self._input_config.name} "
+                    f"within {timeout} seconds"
+                )
+                raise queue.Empty(msg) from err
 
     def kill(self) -> None:
         """Stop the agent process."""
+        self.request_exit()
+        self.proc.join()
+        self.logger.info("Agent process %s terminated", self._input_config.name)
+
+    def request_exit(self) -> None:
+        """Ask the agent process to shut down without waiting for it to exit."""
         self.logger.info(
             "Killing agent process %s (PID: %d)", self._input_config.name, self.proc.pid
         )
         self.input_q.put("__EXIT__")
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the agent process to exit.
+
+        Args:
+            timeout: Optional timeout in seconds
+
+        Returns:
+            bool: True if the process has exited, False if it is still running.
+
+        """
+        self.proc.join(timeout)
+        return not self.proc.is_alive()
+
+    def force_kill(self) -> None:
+        """Kill the agent process with SIGKILL and wait for it to exit."""
+        self.logger.warning(
+            "Force killing agent process %s (PID: %d)",
+            self._input_config.name,
+            self.proc.pid,
+        )
+        self.proc.kill()
         self.proc.join()
-        self.logger.info("Agent process %s terminated", self._input_config.name)
 
     def is_alive(self) -> bool:
         """Check if the agent process is still running.
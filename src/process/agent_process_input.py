@@ -1,3 +1,4 @@
+import hashlib
 import re
 from dataclasses import dataclass
 from typing import List
@@ -21,9 +22,19 @@ class AgentProcessInput:
     tool_names: List[str]
 
     def __post_init__(self) -> None:
-        """Validate all input parameters during initialization."""
+        """Normalize the runner type and validate all input parameters."""
         errors = []
 
+        # Accept the runner type's string value and normalize it to the enum
+        if isinstance(self.child_type, str):
+            try:
+                self.child_type = RunnerType(self.child_type)
+            except ValueError:
+                errors.append(
+                    f"Invalid runner type '{self.child_type}'.\n"
+                    f"Must be one of: {[r.value for r in RunnerType]}"
+                )
+
         # Validate name
         if not self.name:
             errors.append("Agent name cannot be empty")
@@ -38,7 +49,10 @@ class AgentProcessInput:
 
         # Validate child_type against config
         config_manager = get_config_manager()
-        if self.child_type.value not in config_manager.agents:
+        if (
+            isinstance(self.child_type, RunnerType)
+            and self.child_type.value not in config_manager.agents
+        ):
             errors.append(
                 f"Invalid runner type '{self.child_type.value}'.\n"
                 f"Must be one of: {list(config_manager.agents.keys())}"
@@ -62,6 +76,23 @@ class AgentProcessInput:
         if errors:
             raise ChildAgentOperationError(self.name, "validation", "\n".join(errors))
 
+    def config_hash(self) -> str:
+        """Hash the settings that determine how the agent behaves.
+
+        The name is left out and tool order is ignored, so agents created with the
+        same type, instruction and tools hash the same.
+
+        Returns:
+            Hex digest identifying the agent configuration.
+
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.child_type.value, self.instruction, *sorted(self.tool_names)):
+            digest.update(part.encode())
+            # Separator so adjacent fields can't run into each other
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def validate(self) -> list[str]:
         """Validate configuration settings.
 
@@ -75,7 +106,7 @@ class AgentProcessInput:
         config_manager = get_config_manager()
 
         # Validate runner type
-        if self.child_type not in config_manager.agents:
+        if self.child_type.value not in config_manager.agents:
             available = list(config_manager.agents.keys())
             errors.append(
                 f"Invalid runner type '{self.child_type}'. "
@@ -1,6 +1,8 @@
+import itertools
 import logging
+import threading
 from functools import lru_cache
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.config.config_manager import get_config_manager
 from src.process.agent_process import AgentProcess
@@ -34,16 +36,35 @@ class ReplicaManager:
         """
         self.max_children = max_children
         self.children: Dict[str, AgentProcess] = {}
+        # Tools call in from worker threads; guards the limit and name checks
+        self._lock = threading.Lock()
+        # Numbers for generated names; never reused, even after a child is killed
+        self._name_seq = itertools.count(1)
+        # Comma-separated child names, rebuilt only after a child is added or removed
+        self._children_str_cache: Optional[str] = None
+        # Children shared between identical requests: config hash to child name,
+        # and the number of holders per shared child name
+        self._shared_children: Dict[str, str] = {}
+        self._share_counts: Dict[str, int] = {}
         logger.info("Initialized ReplicaManager with max_children=%d", max_children)
 
-    def create_child(self, input_config: AgentProcessInput) -> None:
+    def create_child(self, input_config: AgentProcessInput, share: bool = False) -> str:
         """Create a new child agent process.
 
         Creates and initializes a new agent process with the provided configuration.
-        The agent is registered and started upon successful creation.
+        The agent is registered and started upon successful creation. When sharing
+        is requested and a running shared child has the same type, instruction and
+        tools, that child is reused instead and has to be killed once per creation.
 
         Args:
             input_config: Configuration for the new agent process with core settings.
+            share: Whether the child may be shared with other identical requests
+                that also opt in. Off by default, since a shared child keeps the
+                conversation context of all its holders.
+
+        Returns:
+            str: Name of the child serving the request, which differs from the
+                requested name when an existing child is shared.
 
         Raises:
             MaxChildrenExceededError: If maximum number of children has been reached.
@@ -53,6 +74,38 @@ class ReplicaManager:
         """
         logger.info("Attempting to create child agent '%s'", input_config.child_type)
 
+        with self._lock:
+            if not share:
+                self._create_child_locked(input_config)
+                return input_config.name
+
+            key = input_config.config_hash()
+            shared_name = self._shared_children.get(key)
+            if shared_name is not None:
+                process = self.children.get(shared_name)
+                if process is not None and process.is_alive():
+                    self._share_counts[shared_name] += 1
+                    logger.info(
+                        "Sharing child agent '%s' (%d holders)",
+                        shared_name,
+                        self._share_counts[shared_name],
+                    )
+                    return shared_name
+                # The shared child died; start a fresh one for this config
+                del self._shared_children[key]
+
+            self._create_child_locked(input_config)
+            self._shared_children[key] = input_config.name
+            self._share_counts[input_config.name] = 1
+            return input_config.name
+
+    def _create_child_locked(self, input_config: AgentProcessInput) -> None:
+        """Create and register a child agent process while holding the lock.
+
+        Args:
+            input_config: Configuration for the new agent process with core settings.
+
+        """
         if len(self.children) >= self.max_children:
             logger.warning(
                 "Cannot create child '%s': maximum children limit (%d) reached",
@@ -71,6 +124,7 @@ class ReplicaManager:
             )
             process = AgentProcess(input_config=input_config)
             self.children[input_config.name] = process
+            self._children_str_cache = None
             logger.info("Successfully created child agent '%s'", input_config.name)
         except Exception as e:
             logger.error(
@@ -78,6 +132,68 @@ class ReplicaManager:
             )
             raise ChildAgentOperationError(input_config.name, "creation", str(e)) from e
 
+    def _forget_shared(self, name: str) -> None:
+        """Drop the sharing bookkeeping of a removed child.
+
+        Args:
+            name: The identifier of the removed child.
+
+        """
+        if self._share_counts.pop(name, None) is None:
+            return
+        for key, shared_name in list(self._shared_children.items()):
+            if shared_name == name:
+                del self._shared_children[key]
+
+    def allocate_name(self, prefix: str = "agent") -> str:
+        """Allocate a unique name for a new child agent.
+
+        Args:
+            prefix: Prefix for the generated name.
+
+        Returns:
+            str: A name such as 'agent_3' not used by any current child.
+
+        """
+        with self._lock:
+            name = f"{prefix}_{next(self._name_seq)}"
+            # Skip numbers already taken by explicitly named children
+            while name in self.children:
+                name = f"{prefix}_{next(self._name_seq)}"
+        return name
+
+    def get_children_str(self) -> str:
+        """Get the names of all current children as a comma-separated string.
+
+        Returns:
+            str: The child names joined by ', ', empty if there are no children.
+
+        """
+        # Under the lock, so a stale string can't be cached over a concurrent change
+        with self._lock:
+            if self._children_str_cache is None:
+                self._children_str_cache = ", ".join(self.children)
+            return self._children_str_cache
+
+    def remove_all_children(self) -> List[Tuple[str, AgentProcess]]:
+        """Remove every child from the registry without terminating it.
+
+        Used on shutdown, so children are terminated once even when cleanup runs
+        more than once.
+
+        Returns:
+            List[Tuple[str, AgentProcess]]: Names and processes of the removed
+                children, for the caller to terminate.
+
+        """
+        with self._lock:
+            children = list(self.children.items())
+            self.children.clear()
+            self._children_str_cache = None
+            self._shared_children.clear()
+            self._share_counts.clear()
+        return children
+
     def get_child(self, name: str) -> Optional[AgentProcess]:
         """Get a child agent by name.
 
@@ -145,14 +261,19 @@ class ReplicaManager:
             )
             raise ChildAgentOperationError(name, "question", str(e)) from e
 
-    def kill_child(self, name: str) -> None:
+    def kill_child(self, name: str) -> bool:
         """Terminate a specific child agent process.
 
         Stops and cleans up a child agent process, removing it from the registry.
+        A shared child only releases one holder and keeps running until the last
+        holder kills it.
 
         Args:
             name: The identifier of the child to terminate.
 
+        Returns:
+            bool: True if the process was terminated, False if it is still shared.
+
         Raises:
             ChildAgentNotFoundError: If the specified child does not exist.
             ChildAgentOperationError: If there's an error terminating the process.
@@ -165,6 +286,20 @@ class ReplicaManager:
             logger.warning("Child agent '%s' not found", name)
             raise ChildAgentNotFoundError(name)
 
+        with self._lock:
+            holders = self._share_counts.get(name, 1)
+            if holders > 1:
+                self._share_counts[name] = holders - 1
+                logger.info(
+                    "Released shared child agent '%s' (%d holders left)",
+                    name,
+                    holders - 1,
+                )
+                return False
+            # Stop sharing before the kill so a concurrent create_child can't take
+            # a hold on the dying child
+            self._forget_shared(name)
+
         try:
             if process.is_alive():
                 process.kill()
@@ -172,7 +307,10 @@ class ReplicaManager:
             else:
                 logger.info("Child agent '%s' was already terminated", name)
 
-            del self.children[name]
+            with self._lock:
+                del self.children[name]
+                self._children_str_cache = None
+            return True
         except Exception as e:
             logger.error("Error terminating child agent '%s': %s", name, str(e))
             raise ChildAgentOperationError(name, "termination", str(e)) from e
@@ -19,19 +19,26 @@ class GeminiRunner(AgentRunner):
         instruction: str,
         model: str = "gemini-2.0-flash-001",
         log_level: int = logging.INFO,
+        max_session_turns: Optional[int] = None,
+        api_key: Optional[str] = None,
     ) -> None:
         self.logger = setup_logger(__name__, log_level)
         self.logger.debug("Initializing GeminiRunner")
 
-        self.client: genai.Client = genai.Client()
+        # Without an explicit key the SDK falls back to GOOGLE_API_KEY
+        self.client: genai.Client = genai.Client(api_key=api_key)
         self.model: str = model
         self.instruction: str = instruction
         self.log_level: int = log_level
         self._mcp_client: Client | None = None
         self._event_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        # Set when cleanup ran on the loop itself, which get_response then closes
+        self._close_pending: bool = False
 
         # Initialize session manager immediately
-        self._session_manager: SessionsManager = SessionsManager()
+        self._session_manager: SessionsManager = SessionsManager(
+            max_turns=max_session_turns
+        )
         self._session_id: str = self._session_manager.create_session(instruction)
 
         self.logger.debug("GeminiRunner initialized with session %s", self._session_id)
@@ -91,10 +98,11 @@ class GeminiRunner(AgentRunner):
             )
 
             prompt = ""
-            for user_message, system_message in zip(
-                session.user_messages, session.system_messages
-            ):
-                prompt += "User: " + user_message + "\n"
+            for user_message, system_message in session.turns:
+                # Skip the turn just recorded for this query, it is added below
+                if system_message is None:
+                    continue
+                prompt += "User: " + str(user_message) + "\n"
                 prompt += "System: " + system_message + "\n"
             prompt += "User: " + query_string + "\n"
 
@@ -129,14 +137,40 @@ class GeminiRunner(AgentRunner):
             return response_txt
 
         # Run the async function in the event loop
-        response = self._event_loop.run_until_complete(_get_response())
+        try:
+            response = self._event_loop.run_until_complete(_get_response())
+        finally:
+            if self._close_pending:
+                self._close_stopped_loop()
         return response
 
+    def _close_stopped_loop(self) -> None:
+        """Cancel the tasks left on the stopped event loop, then close it."""
+        loop = self._event_loop
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        self._event_loop = cast(asyncio.AbstractEventLoop, None)
+        self._close_pending = False
+        self.logger.debug("Event loop closed after stopping get_response")
+
     async def cleanup(self) -> None:
         """Clean up the event loop.
 
-        Ensures proper cleanup of async resources by closing the event loop.
+        Ensures proper cleanup of async resources by closing the event loop. When
+        called on the loop itself, e.g. by a cleanup scheduled after a signal
+        interrupted get_response, the loop can't be closed while it runs, so it is
+        stopped instead and get_response closes it on its way out.
         """
-        if self._event_loop and not self._event_loop.is_closed():
-            self._event_loop.close()
-            self._event_loop = cast(asyncio.AbstractEventLoop, None)
+        loop = self._event_loop
+        if not loop or loop.is_closed():
+            return
+        if loop.is_running():
+            self._close_pending = True
+            loop.call_soon_threadsafe(loop.stop)
+            return
+        loop.close()
+        self._event_loop = cast(asyncio.AbstractEventLoop, None)
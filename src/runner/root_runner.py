@@ -1,15 +1,49 @@
 import asyncio
-from typing import Optional
+import textwrap
+from typing import Final, Optional
 
 from fastmcp import Client, FastMCP
 
-from src.config.config_manager import RunnerType, get_config_manager
+from src.config.config_manager import get_config_manager
 from src.dev_testing.server import echo_mcp_server
 from src.process.agent_process_input import AgentProcessInput
 from src.runner.agent_runner import AgentRunner
 from src.runner.runner_factory import create_runner
 from src.tools.mcp_master import get_mcp_master
 from src.tools.replicator_tools import replicator_tools_server
+from src.utils.run_sync import run_sync
+
+# Instruction given to the root agent, dedented once at import time
+_META_INSTRUCTION: Final[str] = textwrap.dedent("""
+    You are the orchestrator agent in charge of managing specialized child agents.
+    Your role is to chat naturally with the user, delegate tasks to child agents
+    using available tools when appropriate, and manage their lifecycle if needed.
+
+    Tool Management and Distribution:
+    - You have access to ALL available tools in the system
+    - When creating child agents, analyze which tools they need for their purpose
+    - Distribute tools thoughtfully - give agents only what they need
+    - Consider these tool distribution principles:
+        * Task-specific tools: Give agents only tools for their domain
+        * Security: Avoid giving sensitive system tools to task-specific agents
+        * Efficiency: Don't overload agents with unnecessary tools
+    - Track which tools you've given to which agents for coordination
+
+    Agent Management:
+    - Create child agents dynamically as needed
+    - When creating an agent, specify instruction and required tool_names
+    - Route follow-up questions to relevant child agents
+    - Summarize child agent responses before replying
+    - Proactively call tools and relay responses when appropriate
+
+    Tools and Capabilities:
+    - Review available tools to understand what capabilities you can grant
+    - Consider tool dependencies for complex tasks
+    - You can adjust tool access for agents as needs change
+
+    Always behave as an intelligent, proactive assistant. Only pause for
+    confirmation when ambiguity exists or user intent is unclear.
+""").strip()
 
 
 def create_root_runner() -> Optional[AgentRunner]:
@@ -27,55 +61,11 @@ def create_root_runner() -> Optional[AgentRunner]:
         Exception: If no main agent is configured or if config is invalid
 
     """
-    config_manager = get_config_manager()
-    main_agent = None
-    main_type: RunnerType | None = None
-
-    # Find the agent marked as main in config
-    for agent_type, runtime in config_manager.agents.items():
-        if runtime.is_main:
-            main_agent = runtime
-            if isinstance(agent_type, str):
-                main_type = RunnerType(agent_type)
-            else:
-                main_type = agent_type
-            break
-
-    if not main_agent or not main_type:
+    main_entry = get_config_manager().main_agent
+    if main_entry is None:
         msg = "No main agent configured. Please mark one agent as 'isMain: true'"
         raise Exception(msg)
-
-    # Create input config for the main agent
-    meta_instruction = """
-        You are the orchestrator agent in charge of managing specialized child agents.
-        Your role is to chat naturally with the user, delegate tasks to child agents
-        using available tools when appropriate, and manage their lifecycle if needed.
-
-        Tool Management and Distribution:
-        - You have access to ALL available tools in the system
-        - When creating child agents, analyze which tools they need for their purpose
-        - Distribute tools thoughtfully - give agents only what they need
-        - Consider these tool distribution principles:
-            * Task-specific tools: Give agents only tools for their domain
-            * Security: Avoid giving sensitive system tools to task-specific agents
-            * Efficiency: Don't overload agents with unnecessary tools
-        - Track which tools you've given to which agents for coordination
-
-        Agent Management:
-        - Create child agents dynamically as needed
-        - When creating an agent, specify instruction and required tool_names
-        - Route follow-up questions to relevant child agents
-        - Summarize child agent responses before replying
-        - Proactively call tools and relay responses when appropriate
-
-        Tools and Capabilities:
-        - Review available tools to understand what capabilities you can grant
-        - Consider tool dependencies for complex tasks
-        - You can adjust tool access for agents as needs change
-
-        Always behave as an intelligent, proactive assistant. Only pause for
-        confirmation when ambiguity exists or user intent is unclear.
-    """
+    main_type, _ = main_entry
 
     # For root agent, always give access to all available tools
     mcp_master = get_mcp_master()
@@ -83,7 +73,7 @@ def create_root_runner() -> Optional[AgentRunner]:
 
     input_config = AgentProcessInput(
         name="main",
-        instruction=meta_instruction,
+        instruction=_META_INSTRUCTION,
         child_type=main_type,
         tool_names=all_tools,
     )
@@ -114,15 +104,33 @@ def _get_client_with_replicator_tools(client: Client) -> Client:
     Returns:
         A new client that has both the original tools and replicator tools
 
+    """
+    return Client(_make_enhanced_server(client))
+
+
+def _make_enhanced_server(client: Client) -> FastMCP:
+    """Build a server exposing the client's tools plus replicator and echo tools.
+
+    Args:
+        client: The existing MCP client to proxy
+
+    Returns:
+        The combined FastMCP server
+
     """
     # Create a new server instance for the enhanced client
     tool_server: FastMCP = FastMCP("enhanced_server")
 
     all_tool_proxy = FastMCP.as_proxy(client)
 
-    # Add the replicator and echo tools
-    asyncio.run(tool_server.import_server("all_tools", all_tool_proxy))
-    asyncio.run(tool_server.import_server("replicator_tools", replicator_tools_server))
-    asyncio.run(tool_server.import_server("echo_tools", echo_mcp_server))
+    # Add the replicator and echo tools, importing all servers on a single loop
+    async def _do_imports() -> None:
+        await asyncio.gather(
+            tool_server.import_server("all_tools", all_tool_proxy),
+            tool_server.import_server("replicator_tools", replicator_tools_server),
+            tool_server.import_server("echo_tools", echo_mcp_server),
+        )
+
+    run_sync(_do_imports())
 
-    return Client(tool_server)
+    return tool_server
@@ -1,12 +1,51 @@
-import os
-from typing import Optional
+from typing import Callable, Dict, Optional
 
-from src.config.config_manager import RunnerType, get_config_manager
+from src.config.config_manager import (
+    AgentRuntime,
+    RunnerType,
+    RuntimeConfig,
+    get_config_manager,
+)
 from src.process.agent_process_input import AgentProcessInput
 from src.runner.agent_runner import AgentRunner
 from src.runner.gemini_runner import GeminiRunner
 from src.tools.mcp_master import get_mcp_master
 
+RunnerBuilder = Callable[
+    [AgentProcessInput, AgentRuntime, Optional[RuntimeConfig]], AgentRunner
+]
+
+
+def _make_gemini_runner(
+    input_config: AgentProcessInput,
+    runtime: AgentRuntime,
+    runtime_config: Optional[RuntimeConfig],
+) -> AgentRunner:
+    """Create a Gemini runner for the given agent configuration.
+
+    Args:
+        input_config: Configuration for the agent process.
+        runtime: Runtime configuration of the Gemini agent.
+        runtime_config: Global runtime configuration, if any.
+
+    Returns:
+        A new GeminiRunner instance.
+
+    """
+    return GeminiRunner(
+        instruction=input_config.instruction,
+        api_key=runtime.api_key,
+        max_session_turns=(
+            runtime_config.max_session_turns if runtime_config else None
+        ),
+    )
+
+
+# Maps each runner type to the function that builds its runner
+_RUNNER_REGISTRY: Dict[RunnerType, RunnerBuilder] = {
+    RunnerType.GEMINI: _make_gemini_runner,
+}
+
 
 def create_runner(input_config: AgentProcessInput) -> Optional[AgentRunner]:
     """Create an agent runner based on configuration.
@@ -22,19 +61,20 @@ def create_runner(input_config: AgentProcessInput) -> Optional[AgentRunner]:
         A configured AgentRunner instance, or None if creation fails.
 
     """
-    # Set up runtime environment first
-    runtime = get_config_manager().agents[input_config.child_type.value]
-    runner = None
-
-    # Create runner based on type
-    if input_config.child_type == RunnerType.GEMINI:
-        os.environ["GOOGLE_API_KEY"] = runtime.api_key
-        runner = GeminiRunner(instruction=input_config.instruction)
-
-        # Configure MCP tools if any are specified
-        if input_config.tool_names:
-            mcp_master = get_mcp_master()
-            mcp_client = mcp_master.create_client_for_tools(input_config.tool_names)
-            runner.configure_mcp(mcp_client)
+    cfg = get_config_manager()
+
+    factory = _RUNNER_REGISTRY.get(input_config.child_type)
+    # get_agent avoids the dict copy made by the agents property
+    runtime = cfg.get_agent(input_config.child_type.value)
+    if factory is None or runtime is None:
+        return None
+
+    runner = factory(input_config, runtime, cfg.runtime)
+
+    # Configure MCP tools if any are specified
+    if input_config.tool_names:
+        mcp_master = get_mcp_master()
+        mcp_client = mcp_master.create_client_for_tools(input_config.tool_names)
+        runner.configure_mcp(mcp_client)
 
     return runner
@@ -1,21 +1,43 @@
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Deque, List, Optional, Tuple
 
+# A single conversation turn: (user message, system message). The system message
+# is None while the turn is still awaiting a response.
+Turn = Tuple[Optional[str], Optional[str]]
 
-@dataclass
+# Wall clock and monotonic readings taken together once per process, used to turn
+# monotonic interaction timestamps back into datetimes for display.
+_WALL_ANCHOR: float = time.time()
+_MONO_ANCHOR_NS: int = time.monotonic_ns()
+
+
+@dataclass(slots=True)
 class Session:
     """A container for managing conversation session data.
 
     Stores the base instruction, message history, and interaction timing for a
-    conversation session between a user and the system.
+    conversation session between a user and the system. The history is kept as a
+    deque of turns, optionally bounded so old turns are dropped from the left.
     """
 
     base_instruction: str
-    user_messages: List[str]
-    system_messages: List[str]
-    last_interaction_time: datetime
+    last_interaction_time_ns: int  # time.monotonic_ns() of the last interaction
     current_turn: str  # Indicates whose turn it is: 'user' or 'system'
+    turns: Deque[Turn] = field(default_factory=deque)
+
+    @property
+    def last_interaction_time(self) -> datetime:
+        """Get the wall clock time of the last interaction.
+
+        Returns:
+            The last interaction time as a local datetime.
+
+        """
+        elapsed = (self.last_interaction_time_ns - _MONO_ANCHOR_NS) / 1e9
+        return datetime.fromtimestamp(_WALL_ANCHOR + elapsed)
 
     def __str__(self) -> str:
         """Return a string representation of the session.
@@ -24,23 +46,21 @@ class Session:
             A formatted string showing the base instruction and message history.
 
         """
-        conversation = []
-        conversation.append(f"Base Instruction: {self.base_instruction}\n")
-        conversation.append(f"Current Turn: {self.current_turn}")
-        conversation.append(f"Last Interaction: {self.last_interaction_time}\n")
-        conversation.append("Conversation History:")
-
-        for i, (user, system) in enumerate(
-            zip(self.user_messages, self.system_messages), 1
-        ):
-            conversation.append(f"\nTurn {i}:")
-            conversation.append(f"User: {user}")
-            conversation.append(f"System: {system}")
-
-        # Add any remaining messages if the lists have different lengths
-        remaining_user = self.user_messages[len(self.system_messages) :]
-        for msg in remaining_user:
-            conversation.append(f"\nUser: {msg}")
-            conversation.append("System: <awaiting response>")
-
-        return "\n".join(conversation)
+        header = (
+            f"Base Instruction: {self.base_instruction}\n\n"
+            f"Current Turn: {self.current_turn}\n"
+            f"Last Interaction: {self.last_interaction_time}\n\n"
+            "Conversation History:"
+        )
+
+        # One formatted block per turn, written into a pre-sized list
+        parts: List[str] = [""] * len(self.turns)
+        turn_number = 0
+        for i, (user, system) in enumerate(self.turns):
+            if system is None:
+                parts[i] = f"\nUser: {user}\nSystem: <awaiting response>"
+            else:
+                turn_number += 1
+                parts[i] = f"\nTurn {turn_number}:\nUser: {user}\nSystem: {system}"
+
+        return "\n".join([header, *parts])
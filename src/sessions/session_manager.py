@@ -1,16 +1,47 @@
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import Dict
+from collections import OrderedDict, deque
+from typing import Optional
 
 from src.sessions.session import Session
 
 
 class SessionsManager:
-    """Manager for handling chat sessions and their associated state."""
+    """Manager for handling chat sessions and their associated state.
 
-    def __init__(self) -> None:
-        # Initialize dict to hold session id to session object mapping
-        self.sessions: Dict[str, Session] = {}
+    All session mutations are guarded by a re-entrant lock so the manager can be
+    shared between threads.
+
+    Sessions are kept in least-recently-used order. Once ``max_sessions`` is
+    reached the least recently used session is evicted, and sessions idle for
+    longer than ``session_ttl_seconds`` are dropped lazily on access.
+    """
+
+    def __init__(
+        self,
+        max_turns: Optional[int] = None,
+        max_sessions: Optional[int] = 1000,
+        session_ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the sessions manager.
+
+        Args:
+            max_turns: Optional cap on the number of turns kept per session. The
+                oldest turns are dropped once the cap is reached.
+            max_sessions: Optional cap on the number of sessions kept.
+            session_ttl_seconds: Optional idle time after which a session expires.
+
+        """
+        # Initialize dict to hold session id to session object mapping, ordered
+        # from least to most recently used
+        self.sessions: OrderedDict[str, Session] = OrderedDict()
+        self.max_turns = max_turns
+        self.max_sessions = max_sessions
+        self._ttl_ns: Optional[int] = (
+            int(session_ttl_seconds * 1e9) if session_ttl_seconds is not None else None
+        )
+        self._lock = threading.RLock()
 
     def create_session(self, base_instruction: str) -> str:
         """Create a new session with the given instruction.
@@ -26,15 +57,71 @@ class SessionsManager:
 
         """
         session_id: str = str(uuid.uuid4())
-        self.sessions[session_id] = Session(
+        session = Session(
             base_instruction=base_instruction,
-            user_messages=[],
-            system_messages=[],
             current_turn="user",
-            last_interaction_time=datetime.now(),
+            last_interaction_time_ns=time.monotonic_ns(),
+            turns=deque(maxlen=self.max_turns),
         )
+        with self._lock:
+            self._evict_expired()
+            if self.max_sessions is not None:
+                while self.sessions and len(self.sessions) >= self.max_sessions:
+                    self.sessions.popitem(last=False)
+            self.sessions[session_id] = session
         return session_id
 
+    def _is_expired(self, session: Session, now_ns: int) -> bool:
+        """Check whether a session has been idle for longer than the TTL.
+
+        Args:
+            session: The session to check.
+            now_ns: The current monotonic time in nanoseconds.
+
+        Returns:
+            bool: True if a TTL is configured and the session exceeded it.
+
+        """
+        return (
+            self._ttl_ns is not None
+            and now_ns - session.last_interaction_time_ns > self._ttl_ns
+        )
+
+    def _evict_expired(self) -> None:
+        """Drop every session that has been idle for longer than the TTL."""
+        if self._ttl_ns is None:
+            return
+        now_ns = time.monotonic_ns()
+        expired = [
+            session_id
+            for session_id, session in self.sessions.items()
+            if self._is_expired(session, now_ns)
+        ]
+        for session_id in expired:
+            del self.sessions[session_id]
+
+    def _touch(self, session_id: str) -> Session | None:
+        """Get a live session and mark it as most recently used.
+
+        Expired sessions are removed instead of returned. Must be called with the
+        lock held.
+
+        Args:
+            session_id: The ID of the session to retrieve.
+
+        Returns:
+            Session | None: The session object if found and live, None otherwise.
+
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        if self._is_expired(session, time.monotonic_ns()):
+            del self.sessions[session_id]
+            return None
+        self.sessions.move_to_end(session_id)
+        return session
+
     def get_session_details(self, session_id: str) -> Session | None:
         """Get the session details for a session object.
 
@@ -45,9 +132,8 @@ class SessionsManager:
             Session | None: The session object if found, None otherwise.
 
         """
-        if session_id in self.sessions:
-            return self.sessions[session_id]
-        return None
+        with self._lock:
+            return self._touch(session_id)
 
     def record_user_interaction(self, session_id: str, user_message: str) -> None:
         """Update the given session with the user message and set turn to system.
@@ -57,12 +143,14 @@ class SessionsManager:
             user_message: The message from the user to record.
 
         """
-        if session_id in self.sessions:
-            self.sessions[session_id].user_messages.append(user_message)
-            self.sessions[session_id].current_turn = "system"
-            self.sessions[session_id].last_interaction_time = datetime.now()
-        else:
-            print(f"Session {session_id} not found")
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                print(f"Session {session_id} not found")
+                return
+            session.turns.append((user_message, None))
+            session.current_turn = "system"
+            session.last_interaction_time_ns = time.monotonic_ns()
 
     def record_system_interaction(self, session_id: str, system_message: str) -> None:
         """Update the given session with the system message and set turn to user.
@@ -72,12 +160,19 @@ class SessionsManager:
             system_message: The message from the system to record.
 
         """
-        if session_id in self.sessions:
-            self.sessions[session_id].system_messages.append(system_message)
-            self.sessions[session_id].current_turn = "user"
-            self.sessions[session_id].last_interaction_time = datetime.now()
-        else:
-            print(f"Session {session_id} not found")
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                print(f"Session {session_id} not found")
+                return
+            turns = session.turns
+            if turns and turns[-1][1] is None:
+                # Complete the turn that is awaiting a response
+                turns[-1] = (turns[-1][0], system_message)
+            else:
+                turns.append((None, system_message))
+            session.current_turn = "user"
+            session.last_interaction_time_ns = time.monotonic_ns()
 
     def delete_session(self, session_id: str) -> None:
         """Remove a session.
@@ -86,7 +181,6 @@ class SessionsManager:
             session_id: The ID of the session to delete.
 
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-        else:
-            print(f"Session {session_id} not found")
+        with self._lock:
+            if self.sessions.pop(session_id, None) is None:
+                print(f"Session {session_id} not found")
@@ -1,29 +1,56 @@
 import asyncio
 import functools
+import hashlib
+import json
 import logging
-from typing import Dict, List
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
 
 from fastmcp import Client
 
-from src.config.config_manager import MCPConfig, get_config_manager
+from src.config.config_handler import CONFIG_DIR
+from src.config.config_manager import (
+    DEFAULT_TOOL_CACHE_TTL_SECONDS,
+    MCPConfig,
+    get_config_manager,
+)
 from src.process.exceptions import UnknownToolError
 from src.utils.logging_config import setup_logger
+from src.utils.run_sync import AsyncLoopThread, get_loop_thread
 
 logger = setup_logger(__name__, logging.INFO)
 
+# Directory holding discovered tool lists, keyed by a hash of the MCP config
+TOOL_CACHE_DIR = os.path.join(CONFIG_DIR, "cache")
+
+# Number of recent discovery timings kept for cache statistics
+_MAX_DISCOVERY_TIMINGS = 100
+
 
 class McpMaster:
     """Master controller for MCP tool servers and tool mapping.
 
     Manages the mapping between tools and their MCP servers, enabling dynamic tool
-    discovery and server configuration.
+    discovery and server configuration. Discovered tool lists are persisted to disk
+    so later processes with the same MCP config can skip discovery, and expire
+    after a configurable time so servers are eventually queried again.
     """
 
-    def __init__(self, mcp_config: MCPConfig | None):
+    def __init__(
+        self,
+        mcp_config: MCPConfig | None,
+        cache_ttl_seconds: float | None = DEFAULT_TOOL_CACHE_TTL_SECONDS,
+    ):
         """Initialize the MCP master controller.
 
         Args:
             mcp_config: Configuration object containing MCP server specs.
+            cache_ttl_seconds: Time after which discovered tool lists are dropped
+                and servers queried again. None keeps them until refresh().
 
         Raises:
             ValueError: If mcp_config is None.
@@ -33,39 +60,234 @@ class McpMaster:
             raise ValueError("MCP configuration cannot be None")
         self._mcp_config = mcp_config
         self._tool_mapping: Dict[str, str] = {}  # Maps tool names to server names
-        self._create_tool_mapping()
+        self._tools_per_server: Dict[str, Tuple[str, ...]] = {}
+        # Reverse of _tool_mapping: the tools each server is the provider for
+        self._server_to_tools: Dict[str, Set[str]] = {}
+        self._available_tools_cache: List[str] | None = None
+        # Per-server config dicts, built once from the MCP config on first use
+        self._per_server_cfg: Dict[str, Dict] = {}
+        # Resolved server sets per tool list, and combined configs per server set
+        self._server_collection_cache: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+        self._combined_cfg_cache: Dict[FrozenSet[str], Dict] = {}
+
+        # Lookups served from cache vs. server discovery runs, and their durations
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._cache_expiry = self._next_cache_expiry()
+        self._cache_stats: Dict[str, Any] = {
+            "hits": 0,
+            "misses": 0,
+            "init_time_ms": deque(maxlen=_MAX_DISCOVERY_TIMINGS),
+        }
+
+        # Discovery runs on the shared event loop, with one short-lived connection
+        # per server queried, so no connection outlives a discovery run
+        self._async: AsyncLoopThread = get_loop_thread()
+
+        # Reuse tool lists discovered by earlier runs with the same config. Servers
+        # whose tools were loaded from disk are queried again on a lookup miss,
+        # in case they gained tools since.
+        self._disk_cached_servers: Set[str] = set()
+        self._cache_path = os.path.join(
+            TOOL_CACHE_DIR, f"mcp_tools_{self._config_hash()}.json"
+        )
+        self._load_disk_cache()
+
+        # Servers are connected lazily on first lookup, unless marked as eager
+        eager_servers = [
+            name
+            for name in self._get_unmapped_servers()
+            if self._mcp_config.get_server(name).eager
+        ]
+        if eager_servers:
+            self._map_servers(eager_servers)
 
     def _create_tool_mapping(self) -> None:
         """Create the internal mapping of tools to their respective servers.
 
-        Queries each configured MCP server to discover its available tools
-        and builds a mapping for future lookups.
+        Queries each configured MCP server that has not been mapped yet to discover
+        its available tools and builds a mapping for future lookups.
         """
         logger.info("Creating tool mapping")
+        self._map_servers(self._get_unmapped_servers())
+        # Sort so the logged mapping doesn't depend on server response order
+        final_mapping = dict(sorted(self._tool_mapping.items()))
+        logger.info("All tools mapped, final mapping: %s", final_mapping)
 
-        for server_name in self._mcp_config.list_servers():
-            logger.info(f"Creating tool mapping for server: {server_name}")
-            server_config = self._generate_mcp_config_from_subconfig(server_name)
-            logger.info(f"Generated server config: {server_config}")
-            tools = asyncio.run(self._get_tool_names(server_config))
-            for tool in tools:
-                self._tool_mapping[tool] = server_name
+    def _get_unmapped_servers(self) -> List[str]:
+        """Get the configured servers whose tools have not been discovered yet.
 
-        logger.info(f"All tools mapped, final mapping: {self._tool_mapping}")
+        Returns:
+            List of server names in configuration order.
+
+        """
+        return [
+            name
+            for name in self._mcp_config.list_servers()
+            if name not in self._tools_per_server
+        ]
 
-    async def _get_tool_names(self, server_config: Dict) -> list[str]:
-        """Get list of tool names available from an MCP server.
+    def _map_servers(self, server_names: List[str]) -> None:
+        """Query the given servers and record their tools in the mapping.
 
         Args:
-            server_config: MCP server configuration dictionary.
+            server_names: Names of the servers to query.
+
+        """
+        if not server_names:
+            return
+
+        # Discover and merge all servers in one trip to the shared event loop
+        start = time.perf_counter()
+        first_discovery = not self._tools_per_server
+        self._async.run(self._build_mapping(server_names))
+        self._disk_cached_servers.difference_update(server_names)
+        if first_discovery:
+            # The TTL runs from when the first tools were discovered
+            self._cache_expiry = self._next_cache_expiry()
+        self._cache_stats["misses"] += 1
+        self._cache_stats["init_time_ms"].append(
+            round((time.perf_counter() - start) * 1000, 1)
+        )
+        self._save_disk_cache()
+
+    def _next_cache_expiry(self) -> float:
+        """Get the monotonic time at which freshly discovered tools expire.
+
+        Returns:
+            Expiry time on the time.monotonic() clock, inf if there is no TTL.
+
+        """
+        if self._cache_ttl_seconds is None:
+            return float("inf")
+        return time.monotonic() + self._cache_ttl_seconds
+
+    def _expire_stale_cache(self) -> None:
+        """Refresh the tool mapping if it has outlived the cache TTL."""
+        if self._tools_per_server and time.monotonic() >= self._cache_expiry:
+            logger.info("Tool cache expired after %s seconds", self._cache_ttl_seconds)
+            self.refresh()
+
+    def _config_hash(self) -> str:
+        """Hash the MCP server configuration to key the on-disk tool cache.
 
         Returns:
-            List of tool names available on the server.
+            Hex digest identifying the current MCP configuration.
+
+        """
+        encoded = json.dumps(self._mcp_config.to_dict(), sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _load_disk_cache(self) -> None:
+        """Load previously discovered tool lists from the on-disk cache, if any."""
+        try:
+            with open(self._cache_path, "r") as f:
+                cached: Dict[str, List[str]] = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable tool cache %s: %s", self._cache_path, e)
+            return
+
+        if self._cache_ttl_seconds is not None:
+            # Entries written by an earlier run only live out the rest of their TTL
+            try:
+                age = time.time() - os.path.getmtime(self._cache_path)
+            except OSError:
+                return
+            if age >= self._cache_ttl_seconds:
+                logger.info("Ignoring expired tool cache %s", self._cache_path)
+                return
+            self._cache_expiry = time.monotonic() + self._cache_ttl_seconds - age
+
+        configured = set(self._mcp_config.list_servers())
+        for server_name, tools in cached.items():
+            if server_name in configured:
+                self._record_tools(server_name, tuple(sys.intern(t) for t in tools))
+        self._disk_cached_servers = set(self._tools_per_server)
+        logger.info("Loaded cached tools for servers: %s", list(self._tools_per_server))
+
+    def _save_disk_cache(self) -> None:
+        """Atomically write the discovered tool lists to the on-disk cache."""
+        try:
+            os.makedirs(TOOL_CACHE_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=TOOL_CACHE_DIR, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(self._tools_per_server, f)
+            os.replace(f.name, self._cache_path)
+        except OSError as e:
+            logger.warning("Could not write tool cache %s: %s", self._cache_path, e)
+
+    def _record_tools(self, server_name: str, tools: Tuple[str, ...]) -> None:
+        """Record the tools offered by a server in the mapping.
+
+        Args:
+            server_name: Name of the server offering the tools.
+            tools: Names of the tools available on the server.
 
         """
+        # Interned keys let dict probes match on identity before comparing text
+        server_name = sys.intern(server_name)
+        # Forget tools the server no longer offers
+        for tool in self._server_to_tools.get(server_name, set()).difference(tools):
+            del self._tool_mapping[tool]
+        self._tools_per_server[server_name] = tools
+        for tool in tools:
+            previous = self._tool_mapping.get(tool)
+            if previous is not None and previous != server_name:
+                # Keep the reverse index in line with the forward mapping
+                self._server_to_tools[previous].discard(tool)
+            self._tool_mapping[tool] = server_name
+        self._server_to_tools[server_name] = set(tools)
+        self._available_tools_cache = None
+        self._server_collection_cache.clear()
+
+    async def _build_mapping(self, server_names: List[str]) -> None:
+        """Discover the tools of several MCP servers concurrently and record them.
+
+        Results are merged in the order the servers were requested, so a tool
+        offered by several servers maps to the last of them.
+
+        Args:
+            server_names: Names of the servers to query.
+
+        """
+        results = await asyncio.gather(
+            *(self._list_tools_for(name) for name in server_names)
+        )
+        for server_name, tools in results:
+            self._record_tools(server_name, tools)
+
+    async def _list_tools_for(self, server_name: str) -> Tuple[str, Tuple[str, ...]]:
+        """Get the tool names of a single MCP server along with its name.
+
+        Args:
+            server_name: Name of the server to query.
+
+        Returns:
+            Tuple of the server name and its available tool names.
+
+        """
+        logger.info("Creating tool mapping for server: %s", server_name)
+        return server_name, await self._get_tool_names(server_name)
+
+    async def _get_tool_names(self, server_name: str) -> Tuple[str, ...]:
+        """Get the tool names available from an MCP server.
+
+        Args:
+            server_name: Name of the server to query.
+
+        Returns:
+            Interned names of the tools available on the server.
+
+        """
+        server_config = self._generate_mcp_config_from_subconfig(server_name)
+        logger.debug("Generated server config: %s", server_config)
+        # Runners talk to the servers through clients of their own, so the
+        # connection is only needed for the listing
         async with Client(server_config) as client:
             tools = await client.list_tools()
-            return [x.name for x in tools]
+            return tuple(sys.intern(x.name) for x in tools)
 
     def _generate_mcp_config_from_subconfig(self, server_name: str) -> Dict:
         """Generate an MCP configuration for a specific server.
@@ -76,42 +298,117 @@ class McpMaster:
         Returns:
             Dictionary containing the MCP server configuration.
 
-        Raises:
-            ValueError: If MCP config not found for the server.
-
         """
-        mcp_config = get_config_manager().get_mcp_config()
-        if mcp_config is None:
-            raise ValueError(f"MCP config not found for server {server_name}")
+        return {"mcpServers": {server_name: self._get_server_config(server_name)}}
 
-        return {
-            "mcpServers": {server_name: mcp_config.get_server(server_name).to_dict()}
-        }
+    def _get_server_config(self, server_name: str) -> Dict:
+        """Get the configuration dictionary for a single server.
+
+        Args:
+            server_name: Name of the server to get the config for.
+
+        Returns:
+            Dictionary with the server's command and args, shared between calls.
+
+        """
+        server_config = self._per_server_cfg.get(server_name)
+        if server_config is None:
+            server_config = self._mcp_config.get_server(server_name).to_dict()
+            self._per_server_cfg[server_name] = server_config
+        return server_config
 
     def get_available_tools(self) -> List[str]:
         """Get all available tool names across MCP servers.
 
+        Connects to any server that has not been mapped yet. The flattened list is
+        built once and reused until the next refresh.
+
         Returns:
             List of all known tool names that can be used with MCP clients.
 
         """
-        return list(self._tool_mapping.keys())
+        self._expire_stale_cache()
+        if self._available_tools_cache is not None:
+            self._cache_stats["hits"] += 1
+        else:
+            self._create_tool_mapping()
+            self._available_tools_cache = list(
+                dict.fromkeys(
+                    tool for tools in self._tools_per_server.values() for tool in tools
+                )
+            )
+        return list(self._available_tools_cache)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get counters describing how well the tool cache is working.
+
+        Returns:
+            Dictionary with lookup hits and misses, the hit rate, recent discovery
+            durations in milliseconds, the servers currently cached and the time
+            left before the cache expires.
+
+        """
+        hits = self._cache_stats["hits"]
+        misses = self._cache_stats["misses"]
+        total = hits + misses
+        expires_in = self._cache_expiry - time.monotonic()
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else None,
+            "init_time_ms": list(self._cache_stats["init_time_ms"]),
+            "cached_servers": sorted(self._tools_per_server),
+            "ttl_seconds": self._cache_ttl_seconds,
+            "expires_in_seconds": (
+                round(max(expires_in, 0.0), 1)
+                if self._cache_ttl_seconds is not None
+                else None
+            ),
+        }
+
+    def refresh(self) -> None:
+        """Drop all cached tool information, including the on-disk cache.
 
-    def _get_server_for_tool(self, tool_name: str) -> str | None:
-        """Get the server name that provides the specified tool.
+        Servers are queried again the next time one of their tools is looked up.
+        """
+        logger.info("Refreshing tool mapping")
+        self._tool_mapping.clear()
+        self._tools_per_server.clear()
+        self._server_to_tools.clear()
+        self._disk_cached_servers.clear()
+        self._available_tools_cache = None
+        self._server_collection_cache.clear()
+        self._combined_cfg_cache.clear()
+        self._cache_expiry = self._next_cache_expiry()
+        try:
+            os.remove(self._cache_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove tool cache %s: %s", self._cache_path, e)
+
+    def _find_covering_servers(self, tools: list[str]) -> Tuple[Set[str], Set[str]]:
+        """Find the mapped servers that provide the given tools.
 
         Args:
-            tool_name: Name of the tool to look up
+            tools: List of tool names to find servers for
 
         Returns:
-            Server name if the tool exists, None otherwise
+            The servers providing the tools, and the tools no mapped server provides
 
         """
-        return (
-            self._tool_mapping[tool_name] if tool_name in self._tool_mapping else None
-        )
-
-    def _get_server_collection_for_tools(self, tools: list[str]) -> set[str]:
+        required_servers: Set[str] = set()
+        # Cover the requested tools server by server with set operations
+        unresolved = set(tools)
+        for server_name, server_tools in self._server_to_tools.items():
+            if not unresolved.isdisjoint(server_tools):
+                required_servers.add(server_name)
+                unresolved -= server_tools
+                if not unresolved:
+                    break
+        return required_servers, unresolved
+
+    def _get_server_collection_for_tools(self, tools: list[str]) -> FrozenSet[str]:
         """Get the set of server names required for the given tools.
 
         Args:
@@ -124,15 +421,41 @@ class McpMaster:
             UnknownToolError: If any tool name is not found in the tool mapping
 
         """
-        required_servers = set()
+        self._expire_stale_cache()
+        key = tuple(sorted(tools))
+        cached = self._server_collection_cache.get(key)
+        if cached is not None:
+            self._cache_stats["hits"] += 1
+            return cached
+
+        misses = self._cache_stats["misses"]
+        required_servers, unresolved = self._find_covering_servers(tools)
+
+        # Only fall back to server discovery for tools no mapped server provides,
+        # querying all unmapped servers, and those last seen in the disk cache,
+        # in one concurrent run
+        if unresolved:
+            to_discover = [
+                name
+                for name in self._mcp_config.list_servers()
+                if name not in self._tools_per_server
+                or name in self._disk_cached_servers
+            ]
+            if to_discover:
+                self._map_servers(to_discover)
+                required_servers, unresolved = self._find_covering_servers(tools)
+
         for tool in tools:
-            server = self._get_server_for_tool(tool)
-            if server is None:
+            if tool in unresolved:
                 raise UnknownToolError(tool)
-            required_servers.add(server)
 
-        logger.info(f"Required servers for tools {tools}: {required_servers}")
-        return required_servers
+        if self._cache_stats["misses"] == misses:
+            self._cache_stats["hits"] += 1
+
+        logger.info("Required servers for tools %s: %s", tools, required_servers)
+        result = frozenset(required_servers)
+        self._server_collection_cache[key] = result
+        return result
 
     def create_client_for_tools(self, tools: list[str]) -> Client:
         """Create an MCP client that has access to all the requested tools.
@@ -155,16 +478,19 @@ class McpMaster:
         # Get all required servers for these tools
         servers = self._get_server_collection_for_tools(tools)
 
-        logger.info("Creating client for tools: {tools}".format(tools=tools))
-        logger.info("Required servers: {servers}".format(servers=servers))
-
-        # Create a combined configuration with all required servers
-        combined_config: dict[str, dict] = {"mcpServers": {}}
-        for server_name in servers:
-            server_config = self._mcp_config.get_server(server_name).to_dict()
-            combined_config["mcpServers"][server_name] = server_config
+        logger.info("Creating client for tools: %s", tools)
+        logger.info("Required servers: %s", servers)
 
-        logger.info("Created combined config: {config}".format(config=combined_config))
+        # Create a combined configuration with all required servers, reusing the
+        # one built for an earlier request needing the same servers
+        combined_config = self._combined_cfg_cache.get(servers)
+        if combined_config is None:
+            # Wrap the shared per-server dicts in the envelope in one step
+            combined_config = {
+                "mcpServers": {name: self._get_server_config(name) for name in servers}
+            }
+            self._combined_cfg_cache[servers] = combined_config
+            logger.debug("Created combined config: %s", combined_config)
 
         # Create and return a client with the combined configuration
         return Client(combined_config)
@@ -181,10 +507,15 @@ def get_mcp_master() -> McpMaster:
         This function is cached, so subsequent calls will return the same instance
 
     """
-    mcp_master = McpMaster(get_config_manager().get_mcp_config())
-    logger.info(
-        "MCP config loaded: {config}".format(
-            config=get_config_manager().get_mcp_config()
-        )
+    config_manager = get_config_manager()
+    runtime = config_manager.runtime
+    mcp_master = McpMaster(
+        config_manager.get_mcp_config(),
+        cache_ttl_seconds=(
+            runtime.tool_cache_ttl_seconds
+            if runtime is not None
+            else DEFAULT_TOOL_CACHE_TTL_SECONDS
+        ),
     )
+    logger.debug("MCP config loaded: %s", get_config_manager().get_mcp_config())
     return mcp_master
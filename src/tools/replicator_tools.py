@@ -1,12 +1,25 @@
+import asyncio
+import functools
 import logging
-from typing import List, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+)
 
 from fastmcp import FastMCP
 
-from src.config.config_manager import RunnerType
+from src.config.config_manager import RunnerType, get_config_manager
 from src.process.agent_process_input import AgentProcessInput
-from src.process.exceptions import ChildAgentNotFoundError
 from src.process.replica_manager import get_replica_manager
+from src.tools.mcp_master import get_mcp_master
 from src.utils.logging_config import setup_logger
 
 # Set up logging
@@ -15,21 +28,90 @@ logger = setup_logger(__name__, logging.INFO)
 # Create FastMCP app
 replicator_tools_server: FastMCP = FastMCP("ReplicatorToolsServer")
 
+# Runner types by their string value, resolved once instead of per request
+_RUNNER_BY_NAME: Dict[str, RunnerType] = {rt.value: rt for rt in RunnerType}
+_AVAILABLE_RUNNERS: Tuple[str, ...] = tuple(_RUNNER_BY_NAME)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _log_exceptions(
+    message: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Log errors raised by a tool before they propagate to the MCP framework.
+
+    Args:
+        message: Prefix for the logged error, e.g. 'Failed to create child agent'.
+
+    Returns:
+        A decorator for async tool functions.
+
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s: %s", message, str(e))
+                # Re-raise the exception to be handled by the MCP framework
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _valid_types() -> FrozenSet[str]:
+    """Get the runner types configured as agents.
+
+    Cached for the lifetime of the process, like the config manager it is read
+    from, so config edits take effect on the next start.
+
+    Returns:
+        FrozenSet[str]: Runner type values that have an agent configured.
+
+    """
+    return frozenset(_available_types())
+
+
+@functools.lru_cache(maxsize=1)
+def _available_types() -> Tuple[str, ...]:
+    """Get the runner types of the configured agents, in config order.
+
+    Cached for the lifetime of the process, like the config manager it is read
+    from, so config edits take effect on the next start.
+
+    Returns:
+        Tuple[str, ...]: Runner type values of the configured agents.
+
+    """
+    return tuple(agent.runner.value for agent in get_config_manager().agents.values())
+
 
 @replicator_tools_server.tool()
+@_log_exceptions("Failed to create child agent")
 async def create_child_agent(
     child_type: str,
-    child_name: str,
     instruction: str,
+    child_name: Optional[str] = None,
     tool_names: Optional[List[str]] = None,
+    share: bool = False,
 ) -> str:
     """Create a new child agent process.
 
     Args:
         child_type: Type of agent to create ('gemini', etc.)
-        child_name: Name for the new child agent
         instruction: Base instruction for the agent
+        child_name: Optional name for the new child agent; a unique name such as
+            'agent_1' is generated when omitted
         tool_names: Optional list of tool names to give the agent access to
+        share: Reuse a running shared agent with the same type, instruction and
+            tools instead of starting a new process. The shared agent keeps the
+            conversation of every holder and may have a different name
 
     Returns:
         Success or error message string
@@ -45,42 +127,55 @@ async def create_child_agent(
         instruction,
     )
 
-    try:
-        # Get the global replica manager
-        replica_manager = get_replica_manager()
-
-        try:
-            # Convert string to RunnerType enum directly
-            runner_type = RunnerType(child_type.lower())
-        except ValueError as err:
-            available_types = [t.value for t in RunnerType]
-            raise ValueError(
-                f"Invalid runner type: {child_type}. Must be one of {available_types}"
-            ) from err
-
-        input_config = AgentProcessInput(
-            name=child_name,
-            child_type=runner_type,
-            instruction=instruction,
-            tool_names=tool_names if tool_names else [],
+    # Get the global replica manager
+    replica_manager = get_replica_manager()
+
+    type_name = child_type.lower()
+    runner_type = _RUNNER_BY_NAME.get(type_name)
+    if runner_type is None:
+        raise ValueError(
+            f"Invalid runner type: {child_type}. "
+            f"Must be one of {list(_AVAILABLE_RUNNERS)}"
         )
-        replica_manager.create_child(input_config)
 
-        success_msg = (
-            f"Successfully created child agent '{child_type}' "
-            f"with instruction: {instruction}"
+    # Only runner types with a configured agent can be created
+    valid_types = _valid_types()
+    if type_name not in valid_types:
+        raise ValueError(
+            f"No agent configured for runner type: {child_type}. "
+            f"Configured types: {sorted(valid_types)}"
         )
-        logger.info(success_msg)
-        return success_msg
 
-    except Exception as e:
-        error_msg = f"Failed to create child agent: {str(e)}"
-        logger.error(error_msg)
-        # Re-raise the exception to be handled by the MCP framework
-        raise
+    if not child_name:
+        child_name = replica_manager.allocate_name()
+
+    input_config = AgentProcessInput(
+        name=child_name,
+        child_type=runner_type,
+        instruction=instruction,
+        tool_names=tool_names if tool_names else [],
+    )
+    # Spawning the process blocks, so keep it off the server's event loop
+    created_name = await asyncio.to_thread(
+        replica_manager.create_child, input_config, share
+    )
+
+    if created_name != child_name:
+        success_msg = (
+            f"Reusing child agent '{created_name}' of type '{child_type}', which "
+            f"already runs with the same instruction and tools"
+        )
+    else:
+        success_msg = (
+            f"Successfully created child agent '{child_name}' of type "
+            f"'{child_type}' with instruction: {instruction}"
+        )
+    logger.info(success_msg)
+    return success_msg
 
 
 @replicator_tools_server.tool()
+@_log_exceptions("Failed to get response from child agent")
 async def ask_child_agent(child_name: str, question: str) -> str:
     """Send a question to a specific child agent and wait for response.
 
@@ -100,28 +195,22 @@ async def ask_child_agent(child_name: str, question: str) -> str:
     """
     logger.info("Received request to ask child agent '%s': %s", child_name, question)
 
-    try:
-        # Get the global replica manager
-        replica_manager = get_replica_manager()
-
-        # Check if the specified child exists
-        if child_name not in replica_manager.children:
-            raise ChildAgentNotFoundError(child_name)
+    # Get the global replica manager
+    replica_manager = get_replica_manager()
 
-        # Ask the question and return the response
-        logger.info("Forwarding question to child agent '%s'", child_name)
-        response: str = replica_manager.ask_child(child_name, question)
-        logger.info("Received response from child agent '%s'", child_name)
-        return response
-
-    except Exception as e:
-        error_msg = f"Failed to get response from child agent: {str(e)}"
-        logger.error(error_msg)
-        # Re-raise the exception to be handled by the MCP framework
-        raise
+    # Ask the question and return the response; the replica manager looks the
+    # child up once and raises ChildAgentNotFoundError if it doesn't exist
+    logger.info("Forwarding question to child agent '%s'", child_name)
+    # Run the blocking round-trip in a thread so other tool calls can proceed
+    response: str = await asyncio.to_thread(
+        replica_manager.ask_child, child_name, question
+    )
+    logger.info("Received response from child agent '%s'", child_name)
+    return response
 
 
 @replicator_tools_server.tool()
+@_log_exceptions("Failed to list child agents")
 async def get_current_children() -> str:
     """List all currently running child agents.
 
@@ -134,31 +223,24 @@ async def get_current_children() -> str:
     """
     logger.info("Received request to list current child agents")
 
-    try:
-        # Get the global replica manager
-        replica_manager = get_replica_manager()
+    # Get the global replica manager
+    replica_manager = get_replica_manager()
 
-        if not replica_manager.children:
-            return "No child agents currently exist"
+    if not replica_manager.children:
+        return "No child agents currently exist"
 
-        # Get all child names and create readable list
-        child_names = list(replica_manager.children.keys())
-        child_list = ", ".join(child_names)
-        msg = (
-            f"Current child agents: {child_list}. "
-            "Use these exact names when working with these agents."
-        )
-        logger.info(msg)
-        return msg
-
-    except Exception as e:
-        error_msg = f"Failed to list child agents: {str(e)}"
-        logger.error(error_msg)
-        # Re-raise the exception to be handled by the MCP framework
-        raise
+    # Reuses the joined names until a child is created or killed
+    child_list = replica_manager.get_children_str()
+    msg = (
+        f"Current child agents: {child_list}. "
+        "Use these exact names when working with these agents."
+    )
+    logger.info(msg)
+    return msg
 
 
 @replicator_tools_server.tool()
+@_log_exceptions("Failed to terminate child agent")
 async def kill_child_agent(child_name: str) -> str:
     """Terminate a specific child agent process.
 
@@ -177,29 +259,24 @@ async def kill_child_agent(child_name: str) -> str:
     """
     logger.info("Received request to terminate child agent '%s'", child_name)
 
-    try:
-        # Get the global replica manager
-        replica_manager = get_replica_manager()
-
-        # Check if the specified child exists
-        if child_name not in replica_manager.children:
-            raise ChildAgentNotFoundError(child_name)
-
-        # Kill the child process
-        replica_manager.kill_child(child_name)
+    # Get the global replica manager
+    replica_manager = get_replica_manager()
 
+    # Kill the child process, unless other holders still share it. The replica
+    # manager raises ChildAgentNotFoundError if the child doesn't exist
+    if replica_manager.kill_child(child_name):
         success_msg = f"Successfully terminated child agent '{child_name}'"
-        logger.info(success_msg)
-        return success_msg
-
-    except Exception as e:
-        error_msg = f"Failed to terminate child agent: {str(e)}"
-        logger.error(error_msg)
-        # Re-raise the exception to be handled by the MCP framework
-        raise
+    else:
+        success_msg = (
+            f"Released child agent '{child_name}'; it keeps running for other "
+            "holders"
+        )
+    logger.info(success_msg)
+    return success_msg
 
 
 @replicator_tools_server.tool()
+@_log_exceptions("Failed to list available child agent types")
 async def get_available_child_types() -> List[str]:
     """Return a list of available child agent types from the config.
 
@@ -208,15 +285,21 @@ async def get_available_child_types() -> List[str]:
 
     """
     logger.info("Received request to list available child agent types")
-    from src.config.config_manager import get_config_manager
-
-    try:
-        config_manager = get_config_manager()
-        available_runners = [
-            agent.runner.value for agent in config_manager.agents.values()
-        ]
-        return available_runners
-    except Exception as e:
-        error_msg = f"Failed to list available child agent types: {str(e)}"
-        logger.error(error_msg)
-        raise
+
+    # Cached for the lifetime of the process instead of built on every call
+    return list(_available_types())
+
+
+@replicator_tools_server.tool()
+@_log_exceptions("Failed to get cache statistics")
+async def get_cache_stats() -> Dict[str, Any]:
+    """Return statistics about the MCP tool cache.
+
+    Returns:
+        Dict[str, Any]: Cache hits and misses, hit rate, recent discovery times in
+            milliseconds, cached servers and seconds until the cache expires.
+
+    """
+    logger.info("Received request for MCP tool cache statistics")
+
+    return get_mcp_master().get_cache_stats()
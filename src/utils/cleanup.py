@@ -2,15 +2,21 @@ import asyncio
 import atexit
 import logging
 import signal
-from typing import TYPE_CHECKING, Optional
+import time
+from typing import TYPE_CHECKING, Any, Coroutine, List, Optional, Set, Tuple
 
 from src.utils.logging_config import setup_logger
+from src.utils.run_sync import shutdown_run_sync
 
 if TYPE_CHECKING:
+    from src.process.agent_process import AgentProcess
     from src.runner.agent_runner import AgentRunner
 
 logger = setup_logger(__name__, logging.INFO)
 
+# Time children get to exit on their own during cleanup before they are killed
+CHILD_EXIT_GRACE_SECONDS = 5.0
+
 
 class ProcessCleanup:
     """Handler for cleaning up agent processes and associated resources.
@@ -23,6 +29,8 @@ class ProcessCleanup:
     def __init__(self) -> None:
         self._runner: Optional["AgentRunner"] = None
         self._registered: bool = False
+        # Cleanup tasks scheduled on a running loop, kept alive until they finish
+        self._pending_tasks: Set[asyncio.Task] = set()
 
     def register_runner(self, runner: "AgentRunner") -> None:
         """Register the main runner instance for cleanup.
@@ -45,33 +53,114 @@ class ProcessCleanup:
         # Cleanup the main runner first
         if self._runner:
             try:
-                asyncio.run(self._runner.cleanup())
+                self._run_coroutine(self._runner.cleanup())
                 logger.info("Main runner cleanup completed")
             except Exception as e:
                 logger.error("Error cleaning up main runner: %s", str(e))
 
-        # Get the replica manager and cleanup all child processes
+        # Get the replica manager and cleanup all child processes. Removing them
+        # from the registry first keeps a repeated cleanup from terminating them
+        # again.
         try:
             replica_manager = get_replica_manager()
-            for name, process in list(replica_manager.children.items()):
-                try:
-                    if process.is_alive():
-                        logger.info("Terminating child process '%s'", name)
-                        process.kill()
-                        logger.info("Successfully terminated child process '%s'", name)
-                except Exception as e:
-                    logger.error(
-                        "Error terminating child process '%s': %s", name, str(e)
-                    )
+            self._terminate_children(replica_manager.remove_all_children())
             logger.info("All child processes cleanup completed")
         except Exception as e:
             logger.error("Error during replica manager cleanup: %s", str(e))
 
+        shutdown_run_sync()
+
+    def _terminate_children(self, children: List[Tuple[str, "AgentProcess"]]) -> None:
+        """Terminate child processes in two phases.
+
+        Every live child is asked to exit before waiting on any of them, so they
+        shut down in parallel. Children still running once the shared grace period
+        is over are killed.
+
+        Args:
+            children: Names and processes of the children to terminate.
+
+        """
+        # No liveness check first: the exit request is harmless to a child that has
+        # already exited, and joining it below returns at once and reaps it
+        live = []
+        for name, process in children:
+            try:
+                logger.info("Terminating child process '%s'", name)
+                process.request_exit()
+                live.append((name, process))
+            except Exception as e:
+                logger.error("Error terminating child process '%s': %s", name, str(e))
+
+        deadline = time.monotonic() + CHILD_EXIT_GRACE_SECONDS
+        for name, process in live:
+            try:
+                if not process.join(timeout=max(deadline - time.monotonic(), 0)):
+                    process.force_kill()
+                logger.info("Successfully terminated child process '%s'", name)
+            except Exception as e:
+                logger.error("Error terminating child process '%s': %s", name, str(e))
+
+    def _run_coroutine(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a cleanup coroutine whether or not an event loop is running.
+
+        asyncio.run fails when called while a loop is running in this thread, e.g.
+        from a signal handler interrupting the loop. In that case the coroutine is
+        scheduled on the running loop instead, since blocking on it there would
+        deadlock. Otherwise it runs to completion on a short-lived loop.
+
+        Args:
+            coro: The cleanup coroutine to run.
+
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            task = loop.create_task(coro)
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._on_cleanup_task_done)
+            logger.info("Scheduled cleanup on the running event loop")
+            return
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def _on_cleanup_task_done(self, task: asyncio.Task) -> None:
+        """Log the outcome of a cleanup task scheduled on a running loop.
+
+        Args:
+            task: The finished cleanup task.
+
+        """
+        self._pending_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error in scheduled cleanup: %s", str(task.exception()))
+
     def _setup_cleanup_handlers(self) -> None:
         """Set up cleanup handlers for various exit scenarios."""
         atexit.register(self.cleanup_all_processes)
-        signal.signal(signal.SIGTERM, lambda sig, frame: self.cleanup_all_processes())
-        signal.signal(signal.SIGINT, lambda sig, frame: self.cleanup_all_processes())
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            # Let the loop run the handler between callbacks rather than inside one
+            loop.add_signal_handler(signal.SIGTERM, self.cleanup_all_processes)
+            loop.add_signal_handler(signal.SIGINT, self.cleanup_all_processes)
+        else:
+            signal.signal(
+                signal.SIGTERM, lambda sig, frame: self.cleanup_all_processes()
+            )
+            signal.signal(
+                signal.SIGINT, lambda sig, frame: self.cleanup_all_processes()
+            )
         logger.debug("Cleanup handlers registered")
 
 
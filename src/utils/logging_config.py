@@ -1,5 +1,71 @@
 # Create new file: src/utils/logging_config.py
+import functools
 import logging
+import os
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Package logger that holds the one handler; module loggers propagate to it
+PACKAGE_LOGGER_NAME = "src"
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_format() -> str:
+    """Get the log format from the config file, falling back to the default.
+
+    Cached so the config manager is only consulted once per process.
+
+    Returns:
+        The format string for log handlers.
+
+    """
+    try:
+        from src.config.config_manager import get_config_manager
+
+        config = get_config_manager()
+        if hasattr(config, "logging") and hasattr(config.logging, "format"):
+            return str(config.logging.format)
+    except Exception:
+        pass
+    return DEFAULT_FORMAT
+
+
+@functools.lru_cache(maxsize=1)
+def _get_formatter() -> logging.Formatter:
+    """Get the formatter shared by all handlers created by setup_logger.
+
+    Returns:
+        A formatter using the resolved log format.
+
+    """
+    return logging.Formatter(_resolve_format())
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_level() -> int:
+    """Get the default logging level from the environment or the config file.
+
+    Cached so the environment and config manager are only consulted once per
+    process.
+
+    Returns:
+        The LOG_LEVEL environment variable's level if set, else the config file's
+        level, else INFO.
+
+    """
+    env_level = os.getenv("LOG_LEVEL", "").upper()
+    if env_level and hasattr(logging, env_level):
+        return int(getattr(logging, env_level))
+
+    try:
+        from src.config.config_manager import get_config_manager
+
+        config = get_config_manager()
+        if hasattr(config, "logging") and hasattr(config.logging, "level"):
+            return int(getattr(logging, config.logging.level.upper()))
+    except Exception:
+        pass
+    return logging.INFO
 
 
 def setup_logger(name: str, level: int | None = None) -> logging.Logger:
@@ -22,46 +88,22 @@ def setup_logger(name: str, level: int | None = None) -> logging.Logger:
     """
     logger = logging.getLogger(name)
 
-    # Only add handler if the logger doesn't already have one
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-
-        # Get format from config if available
-        try:
-            from src.config.config_manager import get_config_manager
-
-            config = get_config_manager()
-            if hasattr(config, "logging") and hasattr(config.logging, "format"):
-                format_str = config.logging.format
-            else:
-                format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        except Exception:
-            format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-        formatter = logging.Formatter(format_str)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-    # Determine logging level
-    if level is not None:
-        log_level = level
-    else:
-        import os
-
-        env_level = os.getenv("LOG_LEVEL", "").upper()
-        if env_level and hasattr(logging, env_level):
-            log_level = getattr(logging, env_level)
-        else:
-            try:
-                from src.config.config_manager import get_config_manager
-
-                config = get_config_manager()
-                if hasattr(config, "logging") and hasattr(config.logging, "level"):
-                    log_level = getattr(logging, config.logging.level.upper())
-                else:
-                    log_level = logging.INFO
-            except Exception:
-                log_level = logging.INFO
-
-    logger.setLevel(log_level)
+    # Modules in the package share the package logger's handler; any other logger
+    # gets its own
+    in_package = name == PACKAGE_LOGGER_NAME or name.startswith(
+        PACKAGE_LOGGER_NAME + "."
+    )
+    handler_owner = logging.getLogger(PACKAGE_LOGGER_NAME) if in_package else logger
+
+    # Only add handler if the owner doesn't already have one
+    if not handler_owner.handlers:
+        # Resolving the format loads the config manager, whose own module logger
+        # may set up the handler first, so check again before adding ours
+        formatter = _get_formatter()
+        if not handler_owner.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(formatter)
+            handler_owner.addHandler(handler)
+
+    logger.setLevel(level if level is not None else _resolve_level())
     return logger
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from src.utils.logging_config import setup_logger
+
+logger = setup_logger(__name__, logging.INFO)
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread:
+    """An event loop running forever on a daemon thread.
+
+    Lets synchronous code drive coroutines without creating and tearing down a
+    loop per call. The loop is started on first use and restarted if its thread
+    is gone, e.g. in a forked child process.
+
+    Args:
+        name: Name given to the loop's thread.
+
+    """
+
+    def __init__(self, name: str = "run-sync-loop") -> None:
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the running event loop, starting it on first use."""
+        with self._lock:
+            # A forked child inherits the loop but not the thread, so start anew
+            if (
+                self._loop is None
+                or self._thread is None
+                or not self._thread.is_alive()
+            ):
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name=self._name, daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                logger.debug("Started event loop thread %s", self._name)
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            The value returned by the coroutine.
+
+        Raises:
+            RuntimeError: If called from the loop's own thread.
+
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(f"Cannot wait on {self._name} from its own thread")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self) -> None:
+        """Stop the loop, join its thread and close the loop.
+
+        Safe to call more than once; a later run() starts a new loop.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None:
+            return
+        if thread is not None and thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result()
+            except Exception as e:
+                logger.error("Error cancelling pending tasks: %s", str(e))
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+        loop.close()
+        logger.debug("Event loop thread %s shut down", self._name)
+
+
+async def _cancel_pending() -> None:
+    """Cancel the tasks still running on a loop and finalize async generators.
+
+    Mirrors the teardown asyncio.run performs, but runs on the loop's own thread
+    so resources are released by the tasks that own them.
+    """
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    await asyncio.get_running_loop().shutdown_asyncgens()
+
+
+# Loop shared by all synchronous callers in the process
+_SHARED_LOOP_THREAD = AsyncLoopThread()
+
+
+def get_loop_thread() -> AsyncLoopThread:
+    """Get the process-wide shared event loop thread.
+
+    Returns:
+        The shared AsyncLoopThread instance.
+
+    """
+    return _SHARED_LOOP_THREAD
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared event loop and wait for its result.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The value returned by the coroutine.
+
+    """
+    return _SHARED_LOOP_THREAD.run(coro)
+
+
+def shutdown_run_sync() -> None:
+    """Stop the shared event loop, join its thread and close the loop."""
+    _SHARED_LOOP_THREAD.stop()
@@ -0,0 +1 @@
+"""Config tests package."""
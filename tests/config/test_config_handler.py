@@ -0,0 +1,112 @@
+"""Test editing the config file."""
+
+import json
+import os
+import shutil
+import stat
+
+import pytest
+
+import src.config.config_handler as config_handler
+
+OLD_CONFIG = {"runners": [], "mcpServers": {}}
+NEW_CONFIG = {"runners": [], "mcpServers": {"files": {"command": "fs", "args": []}}}
+
+
+@pytest.fixture
+def config_file(monkeypatch, tmp_path):
+    """Point the config at tmp_path and use a script as the editor.
+
+    The editor replaces the file it is given with the contents of the file named
+    by the EDITED_CONFIG environment variable.
+    """
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    path = config_dir / "config.json"
+    path.write_text(json.dumps(OLD_CONFIG))
+    monkeypatch.setattr(config_handler, "CONFIG_DIR", str(config_dir))
+    monkeypatch.setattr(config_handler, "CONFIG_FILE", str(path))
+    monkeypatch.setattr(config_handler, "_cached_config", None)
+    monkeypatch.setattr(config_handler, "_cached_stat", None)
+
+    editor = tmp_path / "editor.sh"
+    editor.write_text('#!/bin/sh\ncp "$EDITED_CONFIG" "$1"\n')
+    editor.chmod(editor.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("EDITOR", str(editor))
+    return path
+
+
+def set_edit(monkeypatch, tmp_path, content):
+    """Make the editor script write the given text or bytes."""
+    edited = tmp_path / "edited.json"
+    if isinstance(content, bytes):
+        edited.write_bytes(content)
+    else:
+        edited.write_text(content)
+    monkeypatch.setenv("EDITED_CONFIG", str(edited))
+
+
+def test_edit_config_publishes_valid_edit(monkeypatch, tmp_path, config_file):
+    """Test that a valid edit replaces the config and primes the cache."""
+    set_edit(monkeypatch, tmp_path, json.dumps(NEW_CONFIG))
+
+    config_handler.edit_config()
+
+    assert json.loads(config_file.read_text()) == NEW_CONFIG
+    # The edited copy was renamed over the config, leaving no temp file behind
+    assert [p.name for p in config_file.parent.iterdir()] == ["config.json"]
+
+    # The config is served from the primed cache without parsing the file again
+    def fail_load(f):
+        raise AssertionError("config file parsed again")
+
+    monkeypatch.setattr(config_handler.json, "load", fail_load)
+    assert config_handler.get_config() == NEW_CONFIG
+
+
+def test_edit_config_keeps_config_on_invalid_json(monkeypatch, tmp_path, config_file):
+    """Test that invalid JSON raises and leaves the previous config in place."""
+    assert config_handler.get_config() == OLD_CONFIG
+    set_edit(monkeypatch, tmp_path, "{not json")
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        config_handler.edit_config()
+
+    assert json.loads(config_file.read_text()) == OLD_CONFIG
+    assert config_handler.get_config() == OLD_CONFIG
+
+
+def test_edit_config_keeps_file_mode(monkeypatch, tmp_path, config_file):
+    """Test that publishing the edit keeps the config's permissions."""
+    config_file.chmod(0o644)
+    set_edit(monkeypatch, tmp_path, json.dumps(NEW_CONFIG))
+
+    config_handler.edit_config()
+
+    assert stat.S_IMODE(config_file.stat().st_mode) == 0o644
+
+
+def test_edit_config_keeps_edits_on_invalid_utf8(monkeypatch, tmp_path, config_file):
+    """Test that an edit that isn't valid UTF-8 is kept and reported."""
+    set_edit(monkeypatch, tmp_path, b'{"runners": "\xff"}')
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        config_handler.edit_config()
+
+    assert json.loads(config_file.read_text()) == OLD_CONFIG
+    edited = [p for p in config_file.parent.iterdir() if p != config_file]
+    assert [p.read_bytes() for p in edited] == [b'{"runners": "\xff"}']
+
+
+def test_edit_config_removes_copy_on_failure(monkeypatch, tmp_path, config_file):
+    """Test that the temporary copy is removed if copying the config fails."""
+
+    def fail_copy(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(shutil, "copyfile", fail_copy)
+
+    with pytest.raises(OSError, match="disk full"):
+        config_handler.edit_config()
+
+    assert os.listdir(config_file.parent) == ["config.json"]
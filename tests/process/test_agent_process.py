@@ -0,0 +1,24 @@
+"""Test configuration of the agent process module."""
+
+import pytest
+
+from src.process.agent_process import DEFAULT_ASK_CONCURRENCY, _ask_concurrency_from_env
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, DEFAULT_ASK_CONCURRENCY),
+        ("4", 4),
+        ("0", DEFAULT_ASK_CONCURRENCY),
+        ("-2", DEFAULT_ASK_CONCURRENCY),
+        ("many", DEFAULT_ASK_CONCURRENCY),
+    ],
+)
+def test_ask_concurrency_from_env(monkeypatch, value, expected):
+    """Test that only positive integers are accepted as the ask concurrency."""
+    if value is None:
+        monkeypatch.delenv("ASK_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("ASK_CONCURRENCY", value)
+    assert _ask_concurrency_from_env() == expected
@@ -0,0 +1,78 @@
+"""Test sharing of identical child agents in the replica manager."""
+
+import src.process.replica_manager as replica_manager_module
+from src.process.agent_process_input import AgentProcessInput
+from src.process.replica_manager import ReplicaManager
+
+
+class FakeProcess:
+    """Stand-in for AgentProcess that doesn't spawn a real process."""
+
+    def __init__(self, input_config):
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def kill(self):
+        self.alive = False
+
+
+def make_input(name, instruction="Test instruction"):
+    """Build a child config without tools."""
+    return AgentProcessInput(
+        name=name, instruction=instruction, child_type="gemini", tool_names=[]
+    )
+
+
+def test_identical_children_share_one_process(monkeypatch):
+    """Test that identical requests reuse a running child until the last kill."""
+    monkeypatch.setattr(replica_manager_module, "AgentProcess", FakeProcess)
+    manager = ReplicaManager(max_children=3)
+
+    assert manager.create_child(make_input("first"), share=True) == "first"
+    assert manager.create_child(make_input("second"), share=True) == "first"
+    other = make_input("other", "Other instruction")
+    assert manager.create_child(other, share=True) == "other"
+    assert manager.create_child(make_input("private")) == "private"
+    assert manager.get_children_str() == "first, other, private"
+
+    # The first kill only releases a holder; the second terminates the child
+    assert manager.kill_child("first") is False
+    assert "first" in manager.children
+    assert manager.kill_child("first") is True
+    assert "first" not in manager.children
+
+    # Once killed, the same config starts a new child
+    assert manager.create_child(make_input("third"), share=True) == "third"
+
+
+def test_killed_child_is_not_shared(monkeypatch):
+    """Test that a child being killed can't be picked up by a new request."""
+    monkeypatch.setattr(replica_manager_module, "AgentProcess", FakeProcess)
+    manager = ReplicaManager(max_children=3)
+    manager.create_child(make_input("first"), share=True)
+
+    # Sharing ends before the process is killed
+    kill = FakeProcess.kill
+
+    def kill_and_create(process):
+        kill(process)
+        assert manager.create_child(make_input("second"), share=True) == "second"
+
+    monkeypatch.setattr(FakeProcess, "kill", kill_and_create)
+    assert manager.kill_child("first") is True
+    assert manager.get_children_str() == "second"
+
+
+def test_remove_all_children(monkeypatch):
+    """Test that removed children are returned once and their sharing ends."""
+    monkeypatch.setattr(replica_manager_module, "AgentProcess", FakeProcess)
+    manager = ReplicaManager(max_children=3)
+    manager.create_child(make_input("first"), share=True)
+    manager.create_child(make_input("other", "Other instruction"))
+
+    assert [name for name, _ in manager.remove_all_children()] == ["first", "other"]
+    assert manager.remove_all_children() == []
+    assert manager.get_children_str() == ""
+    assert manager.create_child(make_input("second"), share=True) == "second"
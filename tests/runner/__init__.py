@@ -0,0 +1 @@
+"""Runner tests package."""
@@ -0,0 +1,49 @@
+"""Test shutdown of the Gemini runner's event loop."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.runner.gemini_runner import GeminiRunner
+from src.utils.cleanup import ProcessCleanup
+
+
+def test_cleanup_without_running_loop_closes_loop():
+    """Test that cleanup closes the loop when get_response isn't running."""
+    runner = GeminiRunner("Test instruction", api_key="test-key")
+    loop = runner._event_loop
+
+    asyncio.run(runner.cleanup())
+
+    assert loop.is_closed()
+
+
+def test_cleanup_on_running_loop_stops_and_closes_loop():
+    """Test cleanup scheduled on the runner's loop while a response is pending.
+
+    This is what happens when a signal interrupts get_response: the cleanup
+    handler finds the runner's loop running and schedules the cleanup on it.
+    """
+    runner = GeminiRunner("Test instruction", api_key="test-key")
+    loop = runner._event_loop
+    cancelled = []
+
+    async def generate_content(**kwargs):
+        ProcessCleanup()._run_coroutine(runner.cleanup())
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    runner.client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    )
+
+    with pytest.raises(RuntimeError, match="Event loop stopped"):
+        runner.get_response("Hello")
+
+    assert loop.is_closed()
+    assert runner._event_loop is None
+    assert cancelled == [True]
@@ -0,0 +1 @@
+"""Sessions tests package."""
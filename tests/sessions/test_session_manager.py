@@ -0,0 +1,60 @@
+"""Test session history recording and formatting."""
+
+from src.sessions.session_manager import SessionsManager
+
+
+def test_record_interactions_pairs_turns():
+    """Test that user and system messages are recorded as turns."""
+    manager = SessionsManager()
+    session_id = manager.create_session("Test instruction")
+
+    manager.record_user_interaction(session_id, "hello")
+    manager.record_system_interaction(session_id, "hi")
+    manager.record_user_interaction(session_id, "how are you?")
+
+    session = manager.get_session_details(session_id)
+    assert session is not None
+    assert list(session.turns) == [("hello", "hi"), ("how are you?", None)]
+    assert session.current_turn == "system"
+
+    rendered = str(session)
+    assert "Turn 1:\nUser: hello\nSystem: hi" in rendered
+    assert "User: how are you?\nSystem: <awaiting response>" in rendered
+
+
+def test_max_turns_drops_oldest_turns():
+    """Test that bounded sessions only keep the most recent turns."""
+    manager = SessionsManager(max_turns=2)
+    session_id = manager.create_session("Test instruction")
+
+    for i in range(3):
+        manager.record_user_interaction(session_id, f"user {i}")
+        manager.record_system_interaction(session_id, f"system {i}")
+
+    session = manager.get_session_details(session_id)
+    assert session is not None
+    assert list(session.turns) == [("user 1", "system 1"), ("user 2", "system 2")]
+
+
+def test_least_recently_used_session_is_evicted():
+    """Test that the least recently used session is dropped at capacity."""
+    manager = SessionsManager(max_sessions=2)
+    first = manager.create_session("first")
+    second = manager.create_session("second")
+
+    # Using the first session makes the second one the eviction candidate
+    manager.record_user_interaction(first, "hello")
+    third = manager.create_session("third")
+
+    assert manager.get_session_details(first) is not None
+    assert manager.get_session_details(second) is None
+    assert manager.get_session_details(third) is not None
+
+
+def test_idle_sessions_expire():
+    """Test that sessions idle past the TTL are no longer returned."""
+    manager = SessionsManager(session_ttl_seconds=0)
+    session_id = manager.create_session("Test instruction")
+
+    assert manager.get_session_details(session_id) is None
+    assert session_id not in manager.sessions
@@ -0,0 +1 @@
+"""Tools tests package."""
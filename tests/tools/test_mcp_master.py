@@ -0,0 +1,129 @@
+"""Test tool discovery and caching in the MCP master."""
+
+import time
+
+import pytest
+
+import src.tools.mcp_master as mcp_master_module
+from src.config.config_manager import MCPConfig
+from src.process.exceptions import UnknownToolError
+from src.tools.mcp_master import McpMaster
+from src.utils.run_sync import shutdown_run_sync
+
+SERVER_TOOLS = {
+    "a": ("tool_a", "shared"),
+    "b": ("tool_b", "shared"),
+}
+
+
+@pytest.fixture
+def mcp_config():
+    """Provide an MCP config with two lazily connected servers."""
+    return MCPConfig.from_dict(
+        {
+            "mcpServers": {
+                name: {"command": "python", "args": [f"{name}.py"]}
+                for name in SERVER_TOOLS
+            }
+        }
+    )
+
+
+@pytest.fixture
+def listed_servers(monkeypatch, tmp_path):
+    """Fake server discovery and record the servers queried, in order."""
+    calls = []
+
+    async def get_tool_names(self, server_name):
+        calls.append(server_name)
+        return SERVER_TOOLS[server_name]
+
+    monkeypatch.setattr(McpMaster, "_get_tool_names", get_tool_names)
+    monkeypatch.setattr(mcp_master_module, "TOOL_CACHE_DIR", str(tmp_path))
+    yield calls
+    shutdown_run_sync()
+
+
+def test_servers_are_mapped_lazily(mcp_config, listed_servers):
+    """Test that servers are queried in one run on the first lookup miss."""
+    master = McpMaster(mcp_config)
+    assert listed_servers == []
+
+    assert master._get_server_collection_for_tools(["tool_a", "tool_b"]) == {
+        "a",
+        "b",
+    }
+    assert listed_servers == ["a", "b"]
+    assert master.get_cache_stats()["misses"] == 1
+
+    assert master._get_server_collection_for_tools(["tool_a"]) == {"a"}
+    assert listed_servers == ["a", "b"]
+
+
+def test_duplicate_tool_maps_to_last_server(mcp_config, listed_servers):
+    """Test that a tool offered by several servers maps to the last of them."""
+    master = McpMaster(mcp_config)
+
+    assert master.get_available_tools() == ["tool_a", "shared", "tool_b"]
+    assert master._get_server_collection_for_tools(["shared"]) == {"b"}
+    assert master._get_server_collection_for_tools(["tool_a", "shared"]) == {
+        "a",
+        "b",
+    }
+
+
+def test_warm_start_from_disk_cache(mcp_config, listed_servers):
+    """Test that a new master reuses the tools discovered by an earlier one."""
+    McpMaster(mcp_config).get_available_tools()
+    assert listed_servers == ["a", "b"]
+
+    master = McpMaster(mcp_config)
+    assert master.get_available_tools() == ["tool_a", "shared", "tool_b"]
+    assert master._get_server_collection_for_tools(["tool_b"]) == {"b"}
+    assert listed_servers == ["a", "b"]
+
+
+def test_warm_start_picks_up_new_tools(monkeypatch, mcp_config, listed_servers):
+    """Test that a lookup miss queries servers loaded from disk once more."""
+    McpMaster(mcp_config).get_available_tools()
+    monkeypatch.setitem(SERVER_TOOLS, "b", ("tool_b", "tool_new"))
+
+    master = McpMaster(mcp_config)
+    assert master._get_server_collection_for_tools(["tool_new"]) == {"b"}
+    assert listed_servers == ["a", "b", "a", "b"]
+    # The tool b dropped now maps to the other server offering it
+    assert master._get_server_collection_for_tools(["shared"]) == {"a"}
+
+    # Once queried, a miss no longer triggers discovery
+    with pytest.raises(UnknownToolError):
+        master._get_server_collection_for_tools(["missing"])
+    assert listed_servers == ["a", "b", "a", "b"]
+
+
+def test_cache_expires_after_ttl(mcp_config, listed_servers):
+    """Test that servers are queried again once the cache TTL has passed."""
+    master = McpMaster(mcp_config, cache_ttl_seconds=0.05)
+    master.get_available_tools()
+    master.get_available_tools()
+    assert listed_servers == ["a", "b"]
+
+    time.sleep(0.1)
+    master.get_available_tools()
+    assert listed_servers == ["a", "b", "a", "b"]
+
+
+def test_unknown_tool_raises(mcp_config, listed_servers):
+    """Test that a tool no server offers raises after all servers are queried."""
+    master = McpMaster(mcp_config)
+
+    with pytest.raises(UnknownToolError, match="missing"):
+        master.create_client_for_tools(["tool_a", "missing"])
+    assert listed_servers == ["a", "b"]
+
+
+def test_cache_stats_report_zero_ttl(mcp_config, listed_servers):
+    """Test that a TTL of zero is reported rather than treated as no TTL."""
+    stats = McpMaster(mcp_config, cache_ttl_seconds=0).get_cache_stats()
+
+    assert stats["ttl_seconds"] == 0
+    assert stats["expires_in_seconds"] == 0.0
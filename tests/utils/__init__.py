@@ -0,0 +1 @@
+"""Utils tests package."""
@@ -0,0 +1,38 @@
+"""Test the shared event loop used by synchronous callers."""
+
+import asyncio
+
+import pytest
+
+from src.utils.run_sync import run_sync, shutdown_run_sync
+
+
+def test_run_sync_reuses_one_loop():
+    """Test that coroutines run on the same loop until shutdown."""
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    try:
+        first = run_sync(current_loop())
+        assert run_sync(current_loop()) is first
+    finally:
+        shutdown_run_sync()
+
+    try:
+        assert run_sync(current_loop()) is not first
+    finally:
+        shutdown_run_sync()
+
+
+def test_run_sync_propagates_exceptions():
+    """Test that exceptions raised by the coroutine reach the caller."""
+
+    async def fail() -> None:
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(fail())
+    finally:
+        shutdown_run_sync()